@@ -0,0 +1,174 @@
+"""Offline refresh benchmark for the Waterius integration.
+
+Starts the local fake API (fake_waterius.py), points WateriusApi at it and measures
+a full WateriusCoordinator._async_update_data (cold, then warm) plus raw API
+pagination. Results are printed as one JSON object per scenario, so they can be
+diffed or collected by CI:
+
+    python benchmarks/bench_refresh.py --sources 20 --channels-per-source 3 \\
+        --report-pages 5 --latency-ms 40 --runs 3 --output bench_output.txt
+
+Requires Home Assistant and aiohttp to be importable (same as the integration).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_waterius import PUBLIC_BASE_URL, FakeAccount, start_fake_server  # noqa: E402
+
+from custom_components.waterius.api import WateriusApi  # noqa: E402
+from custom_components.waterius.const import CHANNELS_URL  # noqa: E402
+from custom_components.waterius.scheduler import WateriusRequestScheduler  # noqa: E402
+
+
+class RewritingSession(aiohttp.ClientSession):
+    """Sends requests for account.waterius.ru to the local fake instead."""
+
+    def __init__(self, local_base: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._local_base = local_base
+
+    def request(self, method: str, url: Any, **kwargs: Any):  # type: ignore[override]
+        url = str(url)
+        if url.startswith(PUBLIC_BASE_URL):
+            url = self._local_base + url[len(PUBLIC_BASE_URL) :]
+        return super().request(method, url, **kwargs)
+
+
+def _peak_rss_kb() -> int:
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+async def _measure(name: str, account: FakeAccount, coro_factory) -> Dict[str, Any]:
+    gc.collect()
+    account.reset_counters()
+    tracemalloc.start()
+    started = time.perf_counter()
+    error: Optional[str] = None
+    try:
+        await coro_factory()
+    except Exception as e:  # report, don't abort the whole suite
+        error = f"{type(e).__name__}: {e}"
+    wall = time.perf_counter() - started
+    # Whatever is still traced after the call is retained (e.g. coordinator.data).
+    retained_alloc, peak_alloc = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "scenario": name,
+        "wall_s": round(wall, 4),
+        "http_calls": account.total_calls,
+        "http_calls_by_endpoint": dict(account.calls),
+        "bytes": account.total_bytes,
+        "injected_errors": account.errors,
+        "peak_alloc_kb": peak_alloc // 1024,
+        "retained_alloc_kb": retained_alloc // 1024,
+        "peak_rss_kb": _peak_rss_kb(),
+        "error": error,
+    }
+
+
+async def _run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.waterius.coordinator import WateriusCoordinator
+
+    account = FakeAccount(
+        sources=args.sources,
+        channels_per_source=args.channels_per_source,
+        exports_per_source=args.exports_per_source,
+        page_size=args.page_size,
+        report_pages=args.report_pages,
+        reports_per_page=args.reports_per_page,
+        sent_report_index=None if args.sent_report_index < 0 else args.sent_report_index,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    runner, local_base = await start_fake_server(account)
+    results: List[Dict[str, Any]] = []
+    config = {k: v for k, v in vars(args).items() if k != "output"}
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        async with RewritingSession(local_base) as session:
+            for run in range(args.runs):
+                scheduler = WateriusRequestScheduler(rate=args.rate_limit) if args.rate_limit else None
+                api = WateriusApi(session, "benchmark-token", scheduler=scheduler)
+
+                async def _paginate() -> None:
+                    await api.get_paginated(CHANNELS_URL)
+
+                results.append(await _measure("api.get_paginated(channels)", account, _paginate))
+
+                coordinator = WateriusCoordinator(
+                    hass,
+                    api,
+                    update_interval=timedelta(minutes=15),
+                    reports_concurrency=args.concurrency,
+                )
+
+                async def _refresh() -> None:
+                    coordinator.data = await coordinator._async_update_data()
+
+                results.append(await _measure("coordinator.refresh(cold)", account, _refresh))
+                results.append(await _measure("coordinator.refresh(warm)", account, _refresh))
+
+                for r in results[-3:]:
+                    r["run"] = run
+                    r["config"] = config
+                    r["cache"] = api.cache_stats
+        await hass.async_stop(force=True)
+
+    await runner.cleanup()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    p.add_argument("--sources", type=int, default=10)
+    p.add_argument("--channels-per-source", type=int, default=2)
+    p.add_argument("--exports-per-source", type=int, default=1)
+    p.add_argument("--page-size", type=int, default=20, help="server default page size")
+    p.add_argument("--report-pages", type=int, default=3)
+    p.add_argument("--reports-per-page", type=int, default=20)
+    p.add_argument("--sent-report-index", type=int, default=0, help="first sent report; -1 for never")
+    p.add_argument("--latency-ms", type=float, default=20.0)
+    p.add_argument("--latency-jitter-ms", type=float, default=5.0)
+    p.add_argument("--error-rate", type=float, default=0.0)
+    p.add_argument("--concurrency", type=int, default=4, help="reports_concurrency")
+    p.add_argument("--rate-limit", type=float, default=0.0, help="req/s via the shared scheduler (0: off)")
+    p.add_argument("--runs", type=int, default=1)
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--output", type=str, default=None, help="also write JSON lines to this file")
+    args = p.parse_args(argv)
+
+    results = asyncio.run(_run(args))
+    lines = [json.dumps(r, ensure_ascii=False, sort_keys=True) for r in results]
+    print("\n".join(lines))
+    if args.output:
+        Path(args.output).write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return 1 if any(r["error"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
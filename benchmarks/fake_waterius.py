@@ -0,0 +1,226 @@
+"""Local stand-in for account.waterius.ru used by the benchmarks.
+
+Serves the endpoints the integration talks to, with DRF-style pagination:
+
+    GET  /api/source/
+    GET  /api/channel/
+    GET  /api/channel/{id}/
+    GET  /api/channel/{id}/reports/
+    POST /api/channel/{id}/reports/
+    GET  /api/export/{id}/
+
+Account size, page sizes, latency and error rate are configurable. Every
+response is counted (calls and bytes per endpoint class).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+PUBLIC_BASE_URL = "https://account.waterius.ru"
+
+
+@dataclass
+class FakeAccount:
+    sources: int = 5
+    channels_per_source: int = 2
+    exports_per_source: int = 1
+    page_size: int = 20
+    max_page_size: int = 1000
+    report_pages: int = 3
+    reports_per_page: int = 20
+    # Index of the first report with status "отправлено" (None: never sent).
+    sent_report_index: Optional[int] = 0
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 1
+
+    calls: Dict[str, int] = field(default_factory=dict)
+    bytes_sent: Dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+
+    def reset_counters(self) -> None:
+        self.calls.clear()
+        self.bytes_sent.clear()
+        self.errors = 0
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.bytes_sent.values())
+
+    def source_ids(self) -> List[int]:
+        return [1000 + i for i in range(self.sources)]
+
+    def channel_rows(self) -> List[Dict[str, Any]]:
+        rows = []
+        for s_idx, sid in enumerate(self.source_ids()):
+            for c_idx in range(self.channels_per_source):
+                cid = 50000 + s_idx * 100 + c_idx
+                rows.append(
+                    {
+                        "id": cid,
+                        "source": sid,
+                        "export": 9000 + s_idx * 10 + (c_idx % max(1, self.exports_per_source)),
+                        "data_type": c_idx % 2,
+                        "serial": f"{cid:08d}",
+                        "last_value": round(100 + cid % 97 + 0.123, 3),
+                        "report_status": "ok",
+                        "service_date": "2030-01-01",
+                        "warnings": [],
+                    }
+                )
+        return rows
+
+
+def _paginate(request: web.Request, items: List[Any], account: FakeAccount) -> Dict[str, Any]:
+    try:
+        page = max(1, int(request.query.get("page", "1")))
+    except ValueError:
+        page = 1
+    try:
+        size = int(request.query.get("page_size", account.page_size))
+    except ValueError:
+        size = account.page_size
+    size = max(1, min(size, account.max_page_size))
+
+    start = (page - 1) * size
+    chunk = items[start : start + size]
+    base = PUBLIC_BASE_URL + request.path
+
+    def _link(p: int) -> str:
+        query = f"page={p}"
+        if "page_size" in request.query:
+            query += f"&page_size={size}"
+        return f"{base}?{query}"
+
+    return {
+        "count": len(items),
+        "next": _link(page + 1) if start + size < len(items) else None,
+        "previous": _link(page - 1) if page > 1 else None,
+        "results": chunk,
+    }
+
+
+def _endpoint_class(path: str) -> str:
+    parts = [p for p in path.split("/") if p]
+    if parts[:2] == ["api", "source"]:
+        return "sources"
+    if parts[:2] == ["api", "export"]:
+        return "export_detail"
+    if parts[:2] == ["api", "channel"]:
+        if len(parts) == 2:
+            return "channels"
+        if len(parts) >= 4 and parts[3] == "reports":
+            return "channel_reports"
+        return "channel_detail"
+    return "other"
+
+
+def build_app(account: FakeAccount) -> web.Application:
+    rng = random.Random(account.seed)
+    channels = account.channel_rows()
+    channels_by_id = {row["id"]: row for row in channels}
+
+    def _reports(cid: int) -> List[Dict[str, Any]]:
+        total = account.report_pages * account.reports_per_page
+        out = []
+        for i in range(total):
+            sent = account.sent_report_index is not None and i >= account.sent_report_index
+            out.append(
+                {
+                    "id": cid * 10000 + i,
+                    "timestamp": f"2026-{12 - (i // 28) % 12:02d}-{28 - i % 28:02d}T09:00:00Z",
+                    "value": round(500 - i * 0.5, 3),
+                    "status_text": "Отправлено" if sent else "Ошибка УК",
+                    "uk_read_value": round(499 - i * 0.5, 3),
+                    "uk_send_value": round(500 - i * 0.5, 3),
+                }
+            )
+        return out
+
+    @web.middleware
+    async def _instrument(request: web.Request, handler):
+        cls = _endpoint_class(request.path)
+        account.calls[cls] = account.calls.get(cls, 0) + 1
+        if account.latency_ms or account.latency_jitter_ms:
+            delay = account.latency_ms + rng.uniform(-account.latency_jitter_ms, account.latency_jitter_ms)
+            await asyncio.sleep(max(0.0, delay) / 1000)
+        if account.error_rate and rng.random() < account.error_rate:
+            account.errors += 1
+            resp = web.Response(status=503, text="Service Unavailable")
+        else:
+            resp = await handler(request)
+        account.bytes_sent[cls] = account.bytes_sent.get(cls, 0) + len(resp.body or b"")
+        return resp
+
+    def _json(data: Any) -> web.Response:
+        return web.Response(body=json.dumps(data, ensure_ascii=False).encode(), content_type="application/json")
+
+    async def sources(request: web.Request) -> web.Response:
+        rows = [
+            {"id": sid, "name": f"Waterius {sid}", "last_wakeup": "2026-10-17T03:00:00Z"}
+            for sid in account.source_ids()
+        ]
+        return _json(_paginate(request, rows, account))
+
+    async def channel_list(request: web.Request) -> web.Response:
+        return _json(_paginate(request, channels, account))
+
+    async def channel_detail(request: web.Request) -> web.Response:
+        row = channels_by_id.get(int(request.match_info["cid"]))
+        if row is None:
+            raise web.HTTPNotFound()
+        return _json(row)
+
+    async def channel_reports(request: web.Request) -> web.Response:
+        cid = int(request.match_info["cid"])
+        if cid not in channels_by_id:
+            raise web.HTTPNotFound()
+        return _json(_paginate(request, _reports(cid), account))
+
+    async def send_reading(request: web.Request) -> web.Response:
+        await request.read()
+        return _json({"status": "accepted"})
+
+    async def export_detail(request: web.Request) -> web.Response:
+        ex_id = int(request.match_info["eid"])
+        return _json(
+            {
+                "id": ex_id,
+                "tarif_ended": "2026-11-25",
+                "title2": "УК Пример",
+                "title4": f"Лицевой счёт: {ex_id:010d}",
+                "send_date_description": "с 20 по 25 число",
+                "user_contact": "+70000000000",
+            }
+        )
+
+    app = web.Application(middlewares=[_instrument])
+    app.router.add_get("/api/source/", sources)
+    app.router.add_get("/api/channel/", channel_list)
+    app.router.add_get("/api/channel/{cid}/", channel_detail)
+    app.router.add_get("/api/channel/{cid}/reports/", channel_reports)
+    app.router.add_post("/api/channel/{cid}/reports/", send_reading)
+    app.router.add_get("/api/export/{eid}/", export_detail)
+    return app
+
+
+async def start_fake_server(account: FakeAccount, host: str = "127.0.0.1", port: int = 0):
+    """Start the fake API; returns (runner, base_url)."""
+    runner = web.AppRunner(build_app(account), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    sockets = site._server.sockets  # type: ignore[union-attr]
+    bound_port = sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}"
@@ -1,35 +1,174 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 
+from homeassistant.components import webhook
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-import voluptuous as vol
 
 from .api import WateriusApi
-from .const import DOMAIN, CONF_TOKEN, CONF_SCAN_INTERVAL, SERVICE_SEND_READING, SERVICE_SEND_ALL, CHANNEL_SEND_URL_TEMPLATE
-from .coordinator import WateriusCoordinator
+from .const import (
+    DOMAIN,
+    CONF_TOKEN,
+    CONF_SCAN_INTERVAL,
+    CONF_REPORTS_CONCURRENCY,
+    CONF_REPORTS_INTERVAL,
+    CONF_EXPORTS_INTERVAL,
+    CONF_STALE_AFTER,
+    CONF_ADAPTIVE_POLLING,
+    CONF_LOCAL_PUSH,
+    CONF_WEBHOOK_ID,
+    DEFAULT_REPORTS_CONCURRENCY,
+    DEFAULT_REPORTS_INTERVAL,
+    DEFAULT_EXPORTS_INTERVAL,
+    DEFAULT_STALE_AFTER,
+    DEFAULT_PUSH_RECONCILE_INTERVAL,
+    DATA_SCHEDULER,
+)
+from .coordinator import WateriusCoordinator, channel_key
+from .outbox import WateriusOutbox, async_remove_outbox
+from .push import WateriusPushReceiver
+from .scheduler import WateriusRequestScheduler
+from .services import async_setup_services
+from .snapshot import WateriusSnapshotStore
+from .statistics import WateriusStatisticsImporter, async_remove_statistics_cursors
+from .timeseries import WateriusSeriesStore, async_remove_series
 
 PLATFORMS = ["sensor", "button"]
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN].setdefault(DATA_SCHEDULER, WateriusRequestScheduler())
+    await async_setup_services(hass)
     return True
 
 
+def _token(entry: ConfigEntry) -> str:
+    return entry.options.get(CONF_TOKEN) or entry.data[CONF_TOKEN]
+
+
+def _update_interval(entry: ConfigEntry) -> timedelta:
+    """Polling interval from options (falling back to setup data)."""
+    interval_min = int(entry.options.get(CONF_SCAN_INTERVAL, entry.data.get(CONF_SCAN_INTERVAL, 15)))
+    if entry.data.get(CONF_LOCAL_PUSH, False):
+        # Readings arrive by push; polling only reconciles with the cloud.
+        interval_min = max(interval_min, DEFAULT_PUSH_RECONCILE_INTERVAL)
+    return timedelta(minutes=max(1, interval_min))
+
+
+async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply option changes to the running coordinator and API instead of reloading."""
+    entry_data = hass.data[DOMAIN].get(entry.entry_id)
+    if entry_data is None:
+        return
+    coordinator: WateriusCoordinator = entry_data["coordinator"]
+    token = _token(entry)
+    token_changed = token != coordinator.api.token
+    coordinator.api.set_token(token)
+    interval_changed = coordinator.set_base_interval(_update_interval(entry))
+    if token_changed:
+        # Other account or rotated credentials: refetch everything, entities stay in place.
+        await coordinator.async_request_full_refresh()
+    elif interval_changed:
+        coordinator.async_reschedule()
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     session = async_get_clientsession(hass)
-    api = WateriusApi(session, entry.data[CONF_TOKEN])
+    scheduler: WateriusRequestScheduler = hass.data[DOMAIN].setdefault(DATA_SCHEDULER, WateriusRequestScheduler())
+    scheduler.register_entry(entry.entry_id)
+    api = WateriusApi(session, _token(entry), scheduler=scheduler)
+
+    local_push = bool(entry.data.get(CONF_LOCAL_PUSH, False))
+    if local_push and CONF_WEBHOOK_ID not in entry.data:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()}
+        )
+
+    reports_concurrency = int(entry.data.get(CONF_REPORTS_CONCURRENCY, DEFAULT_REPORTS_CONCURRENCY))
+    reports_min = int(entry.data.get(CONF_REPORTS_INTERVAL, DEFAULT_REPORTS_INTERVAL))
+    exports_min = int(entry.data.get(CONF_EXPORTS_INTERVAL, DEFAULT_EXPORTS_INTERVAL))
+    stale_min = int(entry.data.get(CONF_STALE_AFTER, DEFAULT_STALE_AFTER))
+    series_store = WateriusSeriesStore(hass, entry.entry_id)
+    await series_store.async_load()
+    coordinator = WateriusCoordinator(
+        hass,
+        api,
+        update_interval=_update_interval(entry),
+        reports_concurrency=reports_concurrency,
+        reports_interval=timedelta(minutes=max(1, reports_min)),
+        exports_interval=timedelta(minutes=max(1, exports_min)),
+        stale_after=timedelta(minutes=max(1, stale_min)),
+        adaptive=bool(entry.data.get(CONF_ADAPTIVE_POLLING, False)),
+        snapshot_store=WateriusSnapshotStore(hass, entry.entry_id),
+        series_store=series_store,
+    )
+
+    # Entries sharing the host refresh at staggered phases of the interval.
+    phase = scheduler.phase_offset(entry.entry_id, coordinator.update_interval)
+
+    # Bring entities up from the last snapshot right away and refresh in the background;
+    # without a usable snapshot fall back to the blocking first refresh.
+    if await coordinator.async_restore_snapshot():
+
+        async def _initial_refresh() -> None:
+            await asyncio.sleep(phase.total_seconds())
+            await coordinator.async_refresh()
 
-    interval_min = int(entry.data.get(CONF_SCAN_INTERVAL, 15))
-    coordinator = WateriusCoordinator(hass, api, update_interval=timedelta(minutes=max(1, interval_min)))
-    await coordinator.async_config_entry_first_refresh()
+        entry.async_create_background_task(hass, _initial_refresh(), f"{DOMAIN}_{entry.entry_id}_initial_refresh")
+    else:
+        await coordinator.async_config_entry_first_refresh()
+        coordinator.apply_phase(phase)
 
-    hass.data[DOMAIN][entry.entry_id] = {"coordinator": coordinator}
+    entry.async_on_unload(coordinator.async_start_stale_timer())
+
+    outbox = WateriusOutbox(hass, entry.entry_id, api, coordinator.async_refresh_channels)
+    await outbox.async_load()
+    entry.async_create_background_task(hass, outbox.async_run(), f"{DOMAIN}_{entry.entry_id}_outbox")
+
+    statistics: WateriusStatisticsImporter | None = None
+    if "recorder" in hass.config.components:
+        statistics = WateriusStatisticsImporter(hass, entry.entry_id, api)
+        await statistics.async_load()
+
+        @callback
+        def _import_statistics() -> None:
+            data = coordinator.data
+            if data is None or not coordinator.last_update_success:
+                return
+            changed = coordinator.changed_keys
+            channels = [
+                ch
+                for cid, ch in data.channels_by_id.items()
+                if changed is None or not statistics.has_cursor(cid) or channel_key(cid) in changed
+            ]
+            if channels:
+                entry.async_create_background_task(
+                    hass, statistics.async_import(channels), f"{DOMAIN}_{entry.entry_id}_statistics"
+                )
+
+        entry.async_on_unload(coordinator.async_add_listener(_import_statistics))
+        _import_statistics()
+
+    push: WateriusPushReceiver | None = None
+    if local_push:
+        push = WateriusPushReceiver(hass, entry, coordinator)
+        push.register()
+        entry.async_on_unload(push.unregister)
+        coordinator.logger.debug("Waterius local push endpoint registered (URL is shown in the options)")
+
+    hass.data[DOMAIN][entry.entry_id] = {
+        "coordinator": coordinator,
+        "outbox": outbox,
+        "statistics": statistics,
+        "push": push,
+    }
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
     return True
 
 
@@ -37,4 +176,24 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        hass.data[DOMAIN][DATA_SCHEDULER].unregister_entry(entry.entry_id)
     return unload_ok
+
+
+async def async_remove_config_entry_device(
+    hass: HomeAssistant, entry: ConfigEntry, device_entry: dr.DeviceEntry
+) -> bool:
+    """Allow deleting a device only once its source is gone from the account."""
+    coordinator: WateriusCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    data = coordinator.data
+    if data is None:
+        return False
+    current = {f"source_{sid}" for sid in data.sources}
+    return not any(domain == DOMAIN and ident in current for domain, ident in device_entry.identifiers)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await WateriusSnapshotStore(hass, entry.entry_id).async_remove()
+    await async_remove_outbox(hass, entry.entry_id)
+    await async_remove_statistics_cursors(hass, entry.entry_id)
+    await async_remove_series(hass, entry.entry_id)
@@ -1,21 +1,259 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import aiohttp
+from homeassistant.util.json import json_loads
+
+from .const import (
+    DEFAULT_HTTP_CACHE_SIZE,
+    DEFAULT_JSON_EXECUTOR_THRESHOLD,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PAGE_CONCURRENCY,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_BACKOFF_BASE,
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_RETRY_AFTER_MAX,
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_RESET_TIMEOUT,
+)
+from .ingest import ChannelRow, ReportRow, SourceRow, parse_channel_row, parse_report_row, parse_source_row, to_int
+from .metrics import WateriusMetrics
+from .scheduler import WateriusRequestScheduler, gather_bounded
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
 
 
 class WateriusApiError(Exception):
     """Raised for Waterius API errors."""
 
 
+class WateriusTransportError(WateriusApiError):
+    """Timeout or network failure."""
+
+
+class WateriusHttpError(WateriusApiError):
+    """Non-2xx HTTP response."""
+
+    def __init__(self, message: str, status: int, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class WateriusCircuitOpenError(WateriusApiError):
+    """Request rejected because the circuit breaker is open."""
+
+
+def _is_transient(err: WateriusApiError) -> bool:
+    if isinstance(err, WateriusTransportError):
+        return True
+    return isinstance(err, WateriusHttpError) and err.status in RETRYABLE_STATUSES
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After is either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class _CircuitBreaker:
+    """Closed -> open after N consecutive transient failures -> half-open probe after a timeout."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.times_opened = 0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if self.opened_at is not None and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            else:
+                return False
+        # Half-open: let a single probe through.
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def record_aborted(self) -> None:
+        """Outcome unknown (cancelled or unexpected error): a pending probe counts as a failure."""
+        if self._probe_in_flight:
+            self.record_failure()
+
+    def retry_in(self) -> Optional[float]:
+        if self.state != self.OPEN or self.opened_at is None:
+            return None
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+
+def _set_query(url: str, **params: Any) -> str:
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query.update({k: str(v) for k, v in params.items()})
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _remaining_page_urls(next_url: Any, count: Any, per_page: int) -> Optional[List[str]]:
+    """URLs of pages 2..N derived from the first `next` link, or None if they cannot be predicted."""
+    if not isinstance(next_url, str) or not next_url or type(count) is not int or per_page <= 0:
+        return None
+    page = to_int(dict(parse_qsl(urlsplit(next_url).query)).get("page"))
+    if page is None:
+        # Cursor pagination (or no page numbers): only the next link is known.
+        return None
+    last_page = -(-count // per_page)
+    return [_set_query(next_url, page=p) for p in range(page, last_page + 1)]
+
+
+@dataclass
+class _CachedResponse:
+    data: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    size: int
+
+
 class WateriusApi:
     """Async client for account.waterius.ru API (Token auth)."""
 
-    def __init__(self, session: aiohttp.ClientSession, token: str) -> None:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        token: str,
+        cache_size: int = DEFAULT_HTTP_CACHE_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        retry_after_max: float = DEFAULT_RETRY_AFTER_MAX,
+        circuit_failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        circuit_reset_timeout: float = DEFAULT_CIRCUIT_RESET_TIMEOUT,
+        scheduler: Optional[WateriusRequestScheduler] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        page_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> None:
         self._session = session
         self._token = token
+        self._scheduler = scheduler
+
+        self.page_size = max(0, int(page_size))
+        self.page_concurrency = max(1, int(page_concurrency))
+        # Endpoint paths that answered page_size with a client error.
+        self._page_size_rejected: Set[str] = set()
+
+        self.max_retries = max(0, int(max_retries))
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self.retry_after_max = float(retry_after_max)
+        self._breaker = _CircuitBreaker(circuit_failure_threshold, circuit_reset_timeout)
+        self.retries = 0
+        self.last_error: Optional[str] = None
+        self.metrics = WateriusMetrics()
+
+        # Conditional GET cache: (url, params) -> parsed body + validators, LRU-bounded.
+        self._cache: "OrderedDict[Tuple[str, Tuple[Tuple[str, str], ...]], _CachedResponse]" = OrderedDict()
+        self._cache_size = max(0, int(cache_size))
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+        self.cache_bytes_saved = 0
+
+    @property
+    def transport_state(self) -> Dict[str, Any]:
+        return {
+            "circuit": self._breaker.state,
+            "consecutive_failures": self._breaker.consecutive_failures,
+            "circuit_opened": self._breaker.times_opened,
+            "circuit_retry_in": self._breaker.retry_in(),
+            "retries": self.retries,
+            "last_error": self.last_error,
+            "scheduler": self._scheduler.stats if self._scheduler is not None else None,
+        }
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._cache),
+            "max_entries": self._cache_size,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "evictions": self.cache_evictions,
+            "bytes_saved": self.cache_bytes_saved,
+        }
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    @property
+    def token(self) -> str:
+        return self._token
+
+    def set_token(self, token: str) -> None:
+        """Switch credentials in place; responses cached for the old token are dropped."""
+        if token == self._token:
+            return
+        self._token = token
+        self.clear_cache()
+        self._page_size_rejected.clear()
+        self._breaker.record_success()
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        return url, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+    def _cache_store(self, key, entry: _CachedResponse) -> None:
+        if self._cache_size <= 0:
+            return
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+            self.cache_evictions += 1
 
     def _headers(self) -> Dict[str, str]:
         return {
@@ -23,6 +261,14 @@ class WateriusApi:
             "Accept": "application/json",
         }
 
+    def _backoff_delay(self, attempt: int, err: WateriusApiError) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None if we should give up."""
+        retry_after = getattr(err, "retry_after", None)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.retry_after_max else None
+        # Full jitter exponential backoff.
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2**attempt)))
+
     async def _request_json(
         self,
         method: str,
@@ -32,69 +278,289 @@ class WateriusApi:
         json_body: Optional[Dict[str, Any]] = None,
         timeout: int = 30,
     ) -> Any:
+        if self._scheduler is not None and method == "GET":
+            # Identical GETs (same credentials, URL and params) share one in-flight request.
+            key = (self._token, *self._cache_key(url, params))
+            return await self._scheduler.single_flight(
+                key, lambda: self._request_with_retries(method, url, params=params, timeout=timeout)
+            )
+        return await self._request_with_retries(method, url, params=params, json_body=json_body, timeout=timeout)
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+        timeout: int = 30,
+    ) -> Any:
+        attempts = 1 + (self.max_retries if method == "GET" else 0)
+        attempt = 0
+        while True:
+            if not self._breaker.allow():
+                raise WateriusCircuitOpenError(
+                    f"Circuit open for {url}; retry in {self._breaker.retry_in() or 0:.0f}s"
+                )
+            try:
+                result = await self._request_once(
+                    method, url, params=params, json_body=json_body, timeout=timeout
+                )
+            except WateriusApiError as e:
+                self.last_error = str(e)
+                if not _is_transient(e):
+                    # The API answered (e.g. 4xx): it is up.
+                    self._breaker.record_success()
+                    raise
+                self._breaker.record_failure()
+                attempt += 1
+                delay = self._backoff_delay(attempt - 1, e) if attempt < attempts else None
+                if delay is None or self._breaker.state == _CircuitBreaker.OPEN:
+                    raise
+                self.retries += 1
+                self.metrics.record_retry(url)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Never leave a half-open probe marked in flight, or allow() stays False for good.
+                self._breaker.record_aborted()
+                raise
+
+            self._breaker.record_success()
+            return result
+
+    async def _request_once(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+        timeout: int = 30,
+    ) -> Any:
+        if self._scheduler is not None:
+            await self._scheduler.acquire(urlsplit(url).netloc)
+
+        headers = self._headers()
+        cache_key = None
+        cached: Optional[_CachedResponse] = None
+        if method == "GET":
+            cache_key = self._cache_key(url, params)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    headers["If-Modified-Since"] = cached.last_modified
+
+        started = time.monotonic()
+        size = 0
+        not_modified = False
+        failed = True
         try:
-            async with self._session.request(
-                method,
-                url,
-                params=params,
-                json=json_body,
-                headers=self._headers(),
-                timeout=aiohttp.ClientTimeout(total=timeout),
-            ) as resp:
-                if resp.status == 204:
-                    return None
-
-                if resp.status < 200 or resp.status >= 300:
-                    body = (await resp.text())[:2000]
-                    raise WateriusApiError(f"HTTP {resp.status} for {url}. Body: {body}")
-
-                ct = (resp.headers.get("Content-Type") or "").lower()
-                if "application/json" in ct:
-                    return await resp.json()
-                return await resp.text()
-        except asyncio.TimeoutError as e:
-            raise WateriusApiError(f"Timeout calling {url}") from e
-        except aiohttp.ClientError as e:
-            raise WateriusApiError(f"Network error calling {url}: {e}") from e
-
-    async def get_paginated(self, url: str) -> List[Dict[str, Any]]:
-        """Supports both DRF pagination dict and plain list."""
-        items: List[Dict[str, Any]] = []
+            try:
+                async with self._session.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json_body,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                ) as resp:
+                    data, size, not_modified = await self._read_response(resp, url, cache_key, cached)
+            except asyncio.TimeoutError as e:
+                raise WateriusTransportError(f"Timeout calling {url}") from e
+            except aiohttp.ClientError as e:
+                raise WateriusTransportError(f"Network error calling {url}: {e}") from e
+            failed = False
+            return data
+        finally:
+            self.metrics.record_request(
+                url, time.monotonic() - started, size, error=failed, not_modified=not_modified
+            )
+
+    async def _read_response(
+        self,
+        resp: aiohttp.ClientResponse,
+        url: str,
+        cache_key,
+        cached: Optional[_CachedResponse],
+    ) -> Tuple[Any, int, bool]:
+        """Return (data, body size, served from cache) for a response."""
+        if resp.status == 304 and cached is not None:
+            self.cache_hits += 1
+            self.cache_bytes_saved += cached.size
+            self._cache.move_to_end(cache_key)
+            return cached.data, 0, True
+
+        if cache_key is not None:
+            self.cache_misses += 1
+
+        if resp.status == 204:
+            return None, 0, False
+
+        if resp.status < 200 or resp.status >= 300:
+            body = (await resp.text())[:2000]
+            raise WateriusHttpError(
+                f"HTTP {resp.status} for {url}. Body: {body}",
+                resp.status,
+                _parse_retry_after(resp.headers.get("Retry-After")),
+            )
+
+        raw = await resp.read()
+        ct = (resp.headers.get("Content-Type") or "").lower()
+        if "application/json" in ct:
+            data = await self._decode_json(raw, url)
+        else:
+            data = raw.decode(resp.charset or "utf-8", errors="replace")
+
+        if cache_key is not None:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._cache_store(
+                    cache_key,
+                    _CachedResponse(data=data, etag=etag, last_modified=last_modified, size=len(raw)),
+                )
+            elif cached is not None:
+                self._cache.pop(cache_key, None)
+        return data, len(raw), False
+
+    async def _decode_json(self, raw: bytes, url: str) -> Any:
+        """Decode with HA's fast (orjson) loader; large bodies are decoded off the event loop."""
+        try:
+            if len(raw) >= DEFAULT_JSON_EXECUTOR_THRESHOLD:
+                return await asyncio.get_running_loop().run_in_executor(None, json_loads, raw)
+            return json_loads(raw)
+        except ValueError as e:
+            raise WateriusApiError(f"Invalid JSON from {url}: {e}") from e
+
+    async def iter_paginated(
+        self, url: str, parse: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> AsyncIterator[Any]:
+        """Yield items page by page; supports both DRF pagination dict and plain list.
+
+        The next page is requested only when the consumer asks for more items, so
+        breaking out of the loop early stops pagination. With `parse`, every item is
+        mapped through it and items it returns None for are skipped.
+        """
         next_url: Optional[str] = url
 
         while next_url:
             data = await self._request_json("GET", next_url)
 
             if data is None:
-                return items
+                return
 
             if isinstance(data, dict) and "results" in data:
                 results = data.get("results") or []
-                if isinstance(results, list):
-                    items.extend([x for x in results if isinstance(x, dict)])
                 nxt = data.get("next")
                 next_url = nxt if isinstance(nxt, str) and nxt else None
+                if isinstance(results, list):
+                    for x in results:
+                        if isinstance(x, dict):
+                            item = parse(x) if parse else x
+                            if item is not None:
+                                yield item
                 continue
 
             if isinstance(data, list):
-                items.extend([x for x in data if isinstance(x, dict)])
-                break
+                for x in data:
+                    if isinstance(x, dict):
+                        item = parse(x) if parse else x
+                        if item is not None:
+                            yield item
+                return
 
             raise WateriusApiError(f"Unexpected response format for {next_url}: {type(data)}")
 
+    async def get_paginated(
+        self, url: str, parse: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> List[Any]:
+        """Supports both DRF pagination dict and plain list.
+
+        Requests `page_size` items per page. When the first page carries a total
+        `count` and numbered `next` links, the remaining pages are fetched
+        concurrently and merged in page order; otherwise `next` links are followed
+        one by one. The page size actually returned decides the page count, so a
+        server that ignores page_size still works.
+        """
+        path = urlsplit(url).path
+        first_url = url
+        if self.page_size and path not in self._page_size_rejected:
+            first_url = _set_query(url, page_size=self.page_size)
+        try:
+            data = await self._request_json("GET", first_url)
+        except WateriusHttpError as e:
+            if first_url == url or not 400 <= e.status < 500 or e.status in (401, 403, 429):
+                raise
+            self._page_size_rejected.add(path)
+            return await self.get_paginated(url, parse)
+
+        if not (isinstance(data, dict) and "results" in data):
+            if data is None:
+                return []
+            if isinstance(data, list):
+                return self._parse_items(data, parse)
+            raise WateriusApiError(f"Unexpected response format for {first_url}: {type(data)}")
+
+        first = data.get("results") or []
+        if not isinstance(first, list):
+            first = []
+        items = self._parse_items(first, parse)
+        next_url = data.get("next")
+        page_urls = _remaining_page_urls(next_url, data.get("count"), len(first))
+        if page_urls is None:
+            if isinstance(next_url, str) and next_url:
+                items.extend([x async for x in self.iter_paginated(next_url, parse)])
+            return items
+
+        pages = await gather_bounded(page_urls, lambda u: self._request_json("GET", u), self.page_concurrency)
+        for page_url, page in zip(page_urls, pages):
+            if isinstance(page, BaseException):
+                raise page
+            if not (isinstance(page, dict) and isinstance(page.get("results"), list)):
+                raise WateriusApiError(f"Unexpected response format for {page_url}: {type(page)}")
+            items.extend(self._parse_items(page["results"], parse))
+
+        # The collection grew while we were paging: pick up the tail serially.
+        tail = pages[-1].get("next") if pages else None
+        if isinstance(tail, str) and tail:
+            items.extend([x async for x in self.iter_paginated(tail, parse)])
         return items
 
+    @staticmethod
+    def _parse_items(rows: List[Any], parse: Optional[Callable[[Dict[str, Any]], Any]]) -> List[Any]:
+        if parse is None:
+            return [x for x in rows if isinstance(x, dict)]
+        return [item for x in rows if isinstance(x, dict) and (item := parse(x)) is not None]
+
     async def fetch_channels(self, url: str) -> List[Dict[str, Any]]:
         return await self.get_paginated(url)
 
     async def fetch_sources(self, url: str) -> List[Dict[str, Any]]:
         return await self.get_paginated(url)
 
+    async def fetch_channel_rows(self, url: str) -> List[ChannelRow]:
+        return await self.get_paginated(url, parse_channel_row)
+
+    async def fetch_source_rows(self, url: str) -> List[SourceRow]:
+        return await self.get_paginated(url, parse_source_row)
+
+    async def fetch_source_detail(self, url: str) -> Any:
+        return await self._request_json("GET", url)
+
+    async def fetch_channel_detail(self, url: str) -> Any:
+        return await self._request_json("GET", url)
+
     async def fetch_export_detail(self, url: str) -> Any:
         return await self._request_json("GET", url)
 
-    async def fetch_channel_reports(self, url: str) -> List[Dict[str, Any]]:
-        return await self.get_paginated(url)
+    async def fetch_channel_report_rows(self, url: str) -> List[ReportRow]:
+        return await self.get_paginated(url, parse_report_row)
+
+    def iter_channel_reports(self, url: str) -> AsyncIterator[ReportRow]:
+        return self.iter_paginated(url, parse_report_row)
 
     async def send_reading(self, url: str, value: Any) -> Any:
         """Send reading (value_obj) to reports endpoint."""
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from typing import List, Optional, Set
+
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
+from .coordinator import STRUCTURE_KEY, ChangeKey
 
 
 async def async_setup_entry(
@@ -14,7 +17,34 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ):
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    async_add_entities([WateriusUpdateNowButton(entry, coordinator)], update_before_add=False)
+    known: Set[int] = set()
+    entities: List[ButtonEntity] = [WateriusUpdateNowButton(entry, coordinator)]
+    entities.extend(_new_source_buttons(entry, coordinator, known))
+    async_add_entities(entities, update_before_add=False)
+
+    @callback
+    def _reconcile() -> None:
+        new = _new_source_buttons(entry, coordinator, known, coordinator.changed_keys)
+        if new:
+            async_add_entities(new)
+
+    entry.async_on_unload(coordinator.async_add_keyed_listener(_reconcile, (STRUCTURE_KEY,)))
+
+
+def _new_source_buttons(
+    entry: ConfigEntry, coordinator, known: Set[int], changed: Optional[Set[ChangeKey]] = None
+) -> List[ButtonEntity]:
+    """Refresh buttons for sources not in `known`; with a change set only its source keys are checked."""
+    data = coordinator.data
+    if data is None:
+        return []
+    if changed is None:
+        candidates = data.sources.keys()
+    else:
+        candidates = {item_id for kind, item_id in changed if kind == "source" and item_id in data.sources}
+    new = [sid for sid in candidates if sid not in known]
+    known.update(new)
+    return [WateriusRefreshSourceButton(entry, coordinator, sid) for sid in new]
 
 
 class WateriusUpdateNowButton(ButtonEntity):
@@ -28,4 +58,25 @@ class WateriusUpdateNowButton(ButtonEntity):
         self._attr_unique_id = f"{entry.entry_id}_update_now"
 
     async def async_press(self) -> None:
-        await self._coordinator.async_request_refresh()
+        await self._coordinator.async_request_full_refresh()
+
+
+class WateriusRefreshSourceButton(ButtonEntity):
+    """Refetches one device's channels and exports only."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Обновить"
+    _attr_icon = "mdi:refresh"
+
+    def __init__(self, entry: ConfigEntry, coordinator, source_id: int) -> None:
+        self._entry = entry
+        self._coordinator = coordinator
+        self._source_id = source_id
+        self._attr_unique_id = f"{entry.entry_id}_source_{source_id}_refresh"
+
+    @property
+    def device_info(self):
+        return {"identifiers": {(DOMAIN, f"source_{self._source_id}")}}
+
+    async def async_press(self) -> None:
+        await self._coordinator.async_refresh_targets(source_ids=[self._source_id])
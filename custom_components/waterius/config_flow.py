@@ -2,14 +2,37 @@ from __future__ import annotations
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN, CONF_TOKEN, CONF_NAME, CONF_SCAN_INTERVAL, DEFAULT_NAME
+from .const import (
+    DOMAIN,
+    CONF_TOKEN,
+    CONF_NAME,
+    CONF_SCAN_INTERVAL,
+    CONF_REPORTS_CONCURRENCY,
+    CONF_REPORTS_INTERVAL,
+    CONF_EXPORTS_INTERVAL,
+    CONF_STALE_AFTER,
+    CONF_ADAPTIVE_POLLING,
+    CONF_LOCAL_PUSH,
+    DEFAULT_NAME,
+    DEFAULT_REPORTS_CONCURRENCY,
+    DEFAULT_REPORTS_INTERVAL,
+    DEFAULT_EXPORTS_INTERVAL,
+    DEFAULT_STALE_AFTER,
+)
+from .options_flow import WateriusOptionsFlowHandler
 
 
 class WateriusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
+        return WateriusOptionsFlowHandler(config_entry)
+
     async def async_step_user(self, user_input=None):
         if user_input is None:
             schema = vol.Schema(
@@ -17,6 +40,14 @@ class WateriusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(CONF_NAME, default=DEFAULT_NAME): cv.string,
                     vol.Required(CONF_TOKEN): cv.string,
                     vol.Optional(CONF_SCAN_INTERVAL, default=15): vol.Coerce(int),
+                    vol.Optional(CONF_REPORTS_CONCURRENCY, default=DEFAULT_REPORTS_CONCURRENCY): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=32)
+                    ),
+                    vol.Optional(CONF_REPORTS_INTERVAL, default=DEFAULT_REPORTS_INTERVAL): vol.Coerce(int),
+                    vol.Optional(CONF_EXPORTS_INTERVAL, default=DEFAULT_EXPORTS_INTERVAL): vol.Coerce(int),
+                    vol.Optional(CONF_STALE_AFTER, default=DEFAULT_STALE_AFTER): vol.Coerce(int),
+                    vol.Optional(CONF_ADAPTIVE_POLLING, default=False): cv.boolean,
+                    vol.Optional(CONF_LOCAL_PUSH, default=False): cv.boolean,
                 }
             )
             return self.async_show_form(step_id="user", data_schema=schema)
@@ -34,12 +65,11 @@ class WateriusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_NAME: user_input[CONF_NAME],
                 CONF_TOKEN: token,
                 CONF_SCAN_INTERVAL: int(user_input.get(CONF_SCAN_INTERVAL, 15)),
+                CONF_REPORTS_CONCURRENCY: int(user_input.get(CONF_REPORTS_CONCURRENCY, DEFAULT_REPORTS_CONCURRENCY)),
+                CONF_REPORTS_INTERVAL: int(user_input.get(CONF_REPORTS_INTERVAL, DEFAULT_REPORTS_INTERVAL)),
+                CONF_EXPORTS_INTERVAL: int(user_input.get(CONF_EXPORTS_INTERVAL, DEFAULT_EXPORTS_INTERVAL)),
+                CONF_STALE_AFTER: int(user_input.get(CONF_STALE_AFTER, DEFAULT_STALE_AFTER)),
+                CONF_ADAPTIVE_POLLING: bool(user_input.get(CONF_ADAPTIVE_POLLING, False)),
+                CONF_LOCAL_PUSH: bool(user_input.get(CONF_LOCAL_PUSH, False)),
             },
         )
-
-
-
-@staticmethod
-def async_get_options_flow(config_entry):
-    from .options_flow import WateriusOptionsFlowHandler
-    return WateriusOptionsFlowHandler(config_entry)
@@ -1,17 +1,75 @@
+from datetime import timedelta
+
 DOMAIN = "waterius"
 
 CONF_TOKEN = "token"
 CONF_NAME = "name"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_REPORTS_CONCURRENCY = "reports_concurrency"
+CONF_REPORTS_INTERVAL = "reports_interval"
+CONF_EXPORTS_INTERVAL = "exports_interval"
+CONF_STALE_AFTER = "stale_after"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_LOCAL_PUSH = "local_push"
+CONF_WEBHOOK_ID = "webhook_id"
 
 DEFAULT_NAME = "Waterius"
+DEFAULT_REPORTS_CONCURRENCY = 4
+DEFAULT_REPORTS_INTERVAL = 60  # minutes
+DEFAULT_EXPORTS_INTERVAL = 24 * 60  # minutes
+DEFAULT_STALE_AFTER = 6 * 60  # minutes without fresh data before an entity is unavailable
+DEFAULT_STALE_CHECK_INTERVAL = 1  # minutes between freshness re-checks
+# Data is never stale before this many of the longest poll gaps (one failed poll plus refresh time).
+STALE_POLL_GAPS = 2.5
+
+# Adaptive polling around each device's daily wakeup.
+DEFAULT_WAKEUP_LEAD = 10  # minutes before the expected wakeup
+DEFAULT_WAKEUP_WINDOW = 60  # minutes of dense polling after the expected wakeup
+DEFAULT_ADAPTIVE_MAX_INTERVAL = 6 * 60  # minutes between polls outside the window
+
+# Local push: devices POST readings to a webhook; cloud polling only reconciles.
+DEFAULT_PUSH_RECONCILE_INTERVAL = 6 * 60  # minutes
+
+# Per-channel reading history for derived consumption/flow sensors.
+DEFAULT_SERIES_RAW_RETENTION = timedelta(days=2)  # every reading
+DEFAULT_SERIES_HOURLY_RETENTION = timedelta(days=35)  # last reading per hour
+DEFAULT_SERIES_DAILY_RETENTION = timedelta(days=400)  # last reading per day; older points are dropped
+
+DEFAULT_HTTP_CACHE_SIZE = 256  # cached GET responses (ETag / Last-Modified)
+DEFAULT_JSON_EXECUTOR_THRESHOLD = 256 * 1024  # bytes; larger bodies are decoded in an executor
+
+# Pagination: ask for big pages and fetch the rest in parallel when the total is known.
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_PAGE_CONCURRENCY = 4
+
+# Process-wide request budget per host, shared by all config entries.
+DEFAULT_RATE_LIMIT = 4.0  # requests per second
+DEFAULT_RATE_BURST = 8
+
+DATA_SCHEDULER = "scheduler"
+
+# Transport resilience (idempotent GETs only).
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 1.0  # seconds
+DEFAULT_BACKOFF_MAX = 30.0  # seconds
+DEFAULT_RETRY_AFTER_MAX = 120.0  # longer Retry-After values are not waited for
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_RESET_TIMEOUT = 60.0  # seconds before a half-open probe
+
+# Refresh tiers: sources/channels are polled on every coordinator tick,
+# reports and export details on their own (longer) cadences.
+TIER_CHANNELS = "channels"
+TIER_REPORTS = "reports"
+TIER_EXPORTS = "exports"
 
 BASE_URL = "https://account.waterius.ru"
 CHANNELS_URL = BASE_URL + "/api/channel/"
 SOURCES_URL = BASE_URL + "/api/source/"
+SOURCE_DETAIL_URL_TEMPLATE = BASE_URL + "/api/source/{source_id}/"
 EXPORTS_URL = BASE_URL + "/api/export/"
 EXPORT_DETAIL_URL_TEMPLATE = BASE_URL + "/api/export/{export_id}/"
 CHANNEL_REPORTS_URL_TEMPLATE = BASE_URL + "/api/channel/{channel_id}/reports/"
+CHANNEL_DETAIL_URL_TEMPLATE = BASE_URL + "/api/channel/{channel_id}/"
 
 HA_DEVICE_MANUFACTURER = "Waterius"
 HA_DEVICE_MODEL = "account.waterius.ru"
@@ -40,6 +98,22 @@ DATA_TYPE_UNIT = {
     8: "kWh",
 }
 
+DATA_TYPE_FLOW_UNIT = {
+    0: "m³/h",
+    1: "m³/h",
+    6: "kW",
+    7: "kW",
+    8: "kW",
+}
+
+DATA_TYPE_FLOW_DEVICE_CLASS = {
+    0: "volume_flow_rate",
+    1: "volume_flow_rate",
+    6: "power",
+    7: "power",
+    8: "power",
+}
+
 DATA_TYPE_STATE_CLASS = {
     0: "total_increasing",
     1: "total_increasing",
@@ -56,4 +130,11 @@ DEVICE_CLASS_TITLES = {
 
 SERVICE_SEND_READING = "send_reading"
 SERVICE_SEND_ALL = "send_all"
+SERVICE_REFRESH = "refresh"
 CHANNEL_SEND_URL_TEMPLATE = BASE_URL + "/api/channel/{channel_id}/reports/"
+DEFAULT_SEND_CONCURRENCY = 4
+
+# Outbox for readings that could not be submitted.
+DEFAULT_OUTBOX_BATCH_SIZE = 10
+DEFAULT_OUTBOX_BACKOFF_BASE = 30.0  # seconds
+DEFAULT_OUTBOX_BACKOFF_MAX = 30 * 60.0  # seconds
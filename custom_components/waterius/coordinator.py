@@ -1,45 +1,284 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import timedelta
-from typing import Any, Dict, List, Set
+import asyncio
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import WateriusApi, WateriusApiError
 from .const import (
     CHANNELS_URL,
     SOURCES_URL,
+    SOURCE_DETAIL_URL_TEMPLATE,
     EXPORT_DETAIL_URL_TEMPLATE,
     CHANNEL_REPORTS_URL_TEMPLATE,
+    CHANNEL_DETAIL_URL_TEMPLATE,
+    DEFAULT_REPORTS_CONCURRENCY,
+    DEFAULT_REPORTS_INTERVAL,
+    DEFAULT_EXPORTS_INTERVAL,
+    DEFAULT_STALE_AFTER,
+    DEFAULT_STALE_CHECK_INTERVAL,
+    STALE_POLL_GAPS,
+    DEFAULT_WAKEUP_LEAD,
+    DEFAULT_WAKEUP_WINDOW,
+    DEFAULT_ADAPTIVE_MAX_INTERVAL,
+    TIER_CHANNELS,
+    TIER_REPORTS,
+    TIER_EXPORTS,
 )
-from .helpers import extract_export_id, extract_source_id, extract_uk_period_values
+from .helpers import async_extract_uk_period_values
+from .ingest import ChannelRow, ExportRow, SourceRow, parse_channel_row, parse_export_row, parse_source_row
+from .metrics import PHASE_CHANNELS, PHASE_EXPORTS, PHASE_REPORTS, PHASE_SOURCES, PHASE_TOTAL
+from .scheduler import gather_bounded
+from .snapshot import WateriusSnapshotStore
+from .timeseries import WateriusSeriesStore
+from .wakeup import WakeupTracker
 
 
-@dataclass
+def _iso(ts: Optional[datetime]) -> Optional[str]:
+    return ts.isoformat() if ts is not None else None
+
+
+def _parse_iso(value: Any) -> Optional[datetime]:
+    return dt_util.parse_datetime(value) if isinstance(value, str) else None
+
+
+@dataclass(slots=True)
+class WateriusSource:
+    source_id: int
+    name: str
+    last_wakeup: Any
+
+    @classmethod
+    def from_row(cls, row: SourceRow) -> "WateriusSource":
+        return cls(source_id=row.source_id, name=row.name, last_wakeup=row.last_wakeup)
+
+
+@dataclass(slots=True)
 class WateriusChannel:
+    """Typed channel record parsed once from the /api/channel/ row (the row itself is not kept)."""
+
     channel_id: int
+    source_id: int
+    export_id: Optional[int]
+    data_type: Any
+    serial: Any
+    report_status: Any
+    service_date: Any
+    warnings: Any
     last_value: Any
-    raw: Dict[str, Any]
     uk_vals: Dict[str, Any]
+    # Last time this channel's data was fetched successfully; not part of equality.
+    updated_at: Optional[datetime] = field(default=None, compare=False)
+    error: Optional[str] = None
+
+    @classmethod
+    def from_row(
+        cls,
+        row: ChannelRow,
+        source_id: int,
+        uk_vals: Dict[str, Any],
+        updated_at: Optional[datetime] = None,
+        error: Optional[str] = None,
+    ) -> "WateriusChannel":
+        return cls(
+            channel_id=row.channel_id,
+            source_id=source_id,
+            export_id=row.export_id,
+            data_type=row.data_type,
+            serial=row.serial,
+            report_status=row.report_status,
+            service_date=row.service_date,
+            warnings=row.warnings,
+            last_value=row.last_value,
+            uk_vals=uk_vals,
+            updated_at=updated_at,
+            error=error,
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class WateriusExport:
+    """Typed export detail record (only the fields the entities use)."""
+
     export_id: int
-    raw: Dict[str, Any]
+    tarif_ended: str = ""
+    title2: Any = None
+    title4: Any = None
+    send_date_description: Any = None
+    user_contact: Any = None
+    updated_at: Optional[datetime] = field(default=None, compare=False)
+    error: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, export_id: int, row: ExportRow, updated_at: Optional[datetime] = None) -> "WateriusExport":
+        return cls(export_id, *row, updated_at=updated_at)
+
+
+_CHANNEL_FIELDS = (
+    "channel_id",
+    "source_id",
+    "export_id",
+    "data_type",
+    "serial",
+    "report_status",
+    "service_date",
+    "warnings",
+    "last_value",
+    "uk_vals",
+    "error",
+)
+_EXPORT_FIELDS = ("export_id", "tarif_ended", "title2", "title4", "send_date_description", "user_contact", "error")
 
 
-@dataclass
+@dataclass(slots=True)
 class WateriusData:
-    sources: Dict[int, Dict[str, Any]]
+    sources: Dict[int, WateriusSource]
     channels_by_source: Dict[int, List[WateriusChannel]]
     exports_by_source: Dict[int, Dict[int, WateriusExport]]
 
+    # Lookup indexes, built once per refresh.
+    channels_by_id: Dict[int, WateriusChannel] = field(init=False, repr=False, compare=False)
+    exports_by_id: Dict[int, WateriusExport] = field(init=False, repr=False, compare=False)
+    # Values derived by entities (attributes, parsed dates), valid for this data generation only.
+    memo: Dict[Any, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.channels_by_id = {ch.channel_id: ch for chs in self.channels_by_source.values() for ch in chs}
+        self.exports_by_id = {
+            ex_id: ex for exports in self.exports_by_source.values() for ex_id, ex in exports.items()
+        }
+        self.memo = {}
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form (int keys become strings)."""
+        return {
+            "sources": {
+                str(sid): {"name": src.name, "last_wakeup": src.last_wakeup} for sid, src in self.sources.items()
+            },
+            "channels": [
+                {**{f: getattr(ch, f) for f in _CHANNEL_FIELDS}, "updated_at": _iso(ch.updated_at)}
+                for chs in self.channels_by_source.values()
+                for ch in chs
+            ],
+            "exports": [
+                {**{f: getattr(ex, f) for f in _EXPORT_FIELDS}, "updated_at": _iso(ex.updated_at)}
+                for ex in self.exports_by_id.values()
+            ],
+            "exports_by_source": {
+                str(sid): sorted(exports.keys()) for sid, exports in self.exports_by_source.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "WateriusData":
+        sources = {
+            int(sid): WateriusSource(
+                source_id=int(sid), name=src.get("name") or f"Source {sid}", last_wakeup=src.get("last_wakeup")
+            )
+            for sid, src in (raw.get("sources") or {}).items()
+        }
+        channels_by_source: Dict[int, List[WateriusChannel]] = {sid: [] for sid in sources}
+        for ch in raw.get("channels") or []:
+            channel = WateriusChannel(
+                **{f: ch.get(f) for f in _CHANNEL_FIELDS}, updated_at=_parse_iso(ch.get("updated_at"))
+            )
+            channel.channel_id = int(channel.channel_id)
+            channel.source_id = int(channel.source_id)
+            channel.uk_vals = channel.uk_vals or {}
+            channels_by_source.setdefault(channel.source_id, []).append(channel)
+        exports: Dict[int, WateriusExport] = {}
+        for ex in raw.get("exports") or []:
+            export = WateriusExport(
+                **{f: ex.get(f) for f in _EXPORT_FIELDS}, updated_at=_parse_iso(ex.get("updated_at"))
+            )
+            export.export_id = int(export.export_id)
+            export.tarif_ended = export.tarif_ended or ""
+            exports[export.export_id] = export
+        return cls(
+            sources=sources,
+            channels_by_source=channels_by_source,
+            exports_by_source={
+                int(sid): {int(ex_id): exports[int(ex_id)] for ex_id in ex_ids if int(ex_id) in exports}
+                for sid, ex_ids in (raw.get("exports_by_source") or {}).items()
+            },
+        )
+
+
+# Change-set keys: ("channel", channel_id), ("export", export_id), ("source", source_id),
+# plus STRUCTURE_KEY when the set of known ids changes.
+ChangeKey = Tuple[str, int]
+STRUCTURE_KEY: ChangeKey = ("structure", 0)
+SCHEDULE_KEY: ChangeKey = ("schedule", 0)
+
+
+def channel_key(channel_id: int) -> ChangeKey:
+    return ("channel", channel_id)
+
+
+def export_key(export_id: int) -> ChangeKey:
+    return ("export", export_id)
+
+
+def source_key(source_id: int) -> ChangeKey:
+    return ("source", source_id)
+
+
+def _diff_mapping(kind: str, old: Dict[int, Any], new: Dict[int, Any], changed: Set[ChangeKey]) -> bool:
+    """Add keys of changed/added/removed items to `changed`; return True if the id set differs."""
+    for item_id, item in new.items():
+        if old.get(item_id) != item:
+            changed.add((kind, item_id))
+    removed = old.keys() - new.keys()
+    for item_id in removed:
+        changed.add((kind, item_id))
+    return bool(removed) or len(old) != len(new)
+
+
+def diff_data(old: WateriusData, new: WateriusData) -> Set[ChangeKey]:
+    changed: Set[ChangeKey] = set()
+    structure = _diff_mapping("channel", old.channels_by_id, new.channels_by_id, changed)
+    structure |= _diff_mapping("export", old.exports_by_id, new.exports_by_id, changed)
+    structure |= _diff_mapping("source", old.sources, new.sources, changed)
+    if structure:
+        changed.add(STRUCTURE_KEY)
+    return changed
+
+
+def touched_source_ids(data: WateriusData, changed: Set[ChangeKey]) -> Set[int]:
+    """Current sources whose row or channels appear in `changed`.
+
+    A new export always comes with a changed channel (its export id), so its source is included too.
+    """
+    touched: Set[int] = set()
+    for kind, item_id in changed:
+        if kind == "source" and item_id in data.sources:
+            touched.add(item_id)
+        elif kind == "channel" and (ch := data.channels_by_id.get(item_id)) is not None:
+            touched.add(ch.source_id)
+    return touched
+
 
 class WateriusCoordinator(DataUpdateCoordinator[WateriusData]):
-    def __init__(self, hass: HomeAssistant, api: WateriusApi, update_interval: timedelta) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: WateriusApi,
+        update_interval: timedelta,
+        reports_concurrency: int = DEFAULT_REPORTS_CONCURRENCY,
+        reports_interval: timedelta = timedelta(minutes=DEFAULT_REPORTS_INTERVAL),
+        exports_interval: timedelta = timedelta(minutes=DEFAULT_EXPORTS_INTERVAL),
+        stale_after: timedelta = timedelta(minutes=DEFAULT_STALE_AFTER),
+        adaptive: bool = False,
+        snapshot_store: Optional[WateriusSnapshotStore] = None,
+        series_store: Optional[WateriusSeriesStore] = None,
+    ) -> None:
         super().__init__(
             hass,
             logger=__import__("logging").getLogger(__name__),
@@ -47,79 +286,549 @@ class WateriusCoordinator(DataUpdateCoordinator[WateriusData]):
             update_interval=update_interval,
         )
         self.api = api
+        self.reports_concurrency = max(1, int(reports_concurrency))
+        self.tier_intervals: Dict[str, timedelta] = {
+            TIER_REPORTS: reports_interval,
+            TIER_EXPORTS: exports_interval,
+        }
+        self._tier_fetched_at: Dict[str, datetime] = {}
+        self._force_tiers: Set[str] = set()
 
-    async def _async_update_data(self) -> WateriusData:
-        try:
-            sources_raw = await self.api.fetch_sources(SOURCES_URL)
-
-            sources: Dict[int, Dict[str, Any]] = {}
-            for src in sources_raw:
-                if "id" not in src:
-                    continue
-                try:
-                    sid = int(src["id"])
-                except Exception:
-                    continue
-                sources[sid] = src
-
-            channels_raw = await self.api.fetch_channels(CHANNELS_URL)
-
-            channels_by_source: Dict[int, List[WateriusChannel]] = {}
-            export_ids_all: Set[int] = set()
-
-            for ch in channels_raw:
-                if "id" not in ch:
-                    continue
-                try:
-                    channel_id = int(ch["id"])
-                except Exception:
-                    continue
-
-                sid = extract_source_id(ch)
-                if sid is None:
-                    continue
-
-                export_id = extract_export_id(ch)
-                if export_id is not None:
-                    export_ids_all.add(export_id)
-
-                last_value = ch.get("last_value", ch.get("value", ch.get("last")))
-
-                rep_url = CHANNEL_REPORTS_URL_TEMPLATE.format(channel_id=channel_id)
-                reports = await self.api.fetch_channel_reports(rep_url)
-                uk_vals = extract_uk_period_values(reports)
-
-                channels_by_source.setdefault(sid, []).append(
-                    WateriusChannel(channel_id=channel_id, last_value=last_value, raw=ch, uk_vals=uk_vals)
-                )
+        self._snapshot_store = snapshot_store
+        self.series = series_store
 
-            for sid in sources.keys():
-                channels_by_source.setdefault(sid, [])
+        # Keys changed by the last update; None means "everything" (first data, availability flip).
+        self.changed_keys: Optional[Set[ChangeKey]] = None
+        self.suppressed_writes = 0
+        self._notified_data: Optional[WateriusData] = None
+        self._notified_success = True
 
-            export_details: Dict[int, Dict[str, Any]] = {}
-            for ex_id in sorted(export_ids_all):
-                detail_url = EXPORT_DETAIL_URL_TEMPLATE.format(export_id=ex_id)
-                detail = await self.api.fetch_export_detail(detail_url)
-                export_details[ex_id] = detail if isinstance(detail, dict) else {"raw": detail}
-
-            exports_by_source: Dict[int, Dict[int, WateriusExport]] = {}
-            for sid, chs in channels_by_source.items():
-                ex_ids: Set[int] = set()
-                for ch in chs:
-                    ex_id = extract_export_id(ch.raw)
-                    if ex_id is not None:
-                        ex_ids.add(ex_id)
-                if ex_ids:
-                    exports_by_source[sid] = {
-                        ex_id: WateriusExport(export_id=ex_id, raw=export_details.get(ex_id, {}))
-                        for ex_id in ex_ids
-                    }
-
-            return WateriusData(
-                sources=sources,
-                channels_by_source=channels_by_source,
-                exports_by_source=exports_by_source,
+        self.stale_after = stale_after
+        self._stale_keys: Set[ChangeKey] = set()
+
+        # Adaptive mode: poll densely (base interval) only around expected device wakeups.
+        self.adaptive = adaptive
+        self.base_interval = update_interval
+        self.adaptive_max_interval = timedelta(minutes=DEFAULT_ADAPTIVE_MAX_INTERVAL)
+        self.wakeups = WakeupTracker(
+            lead=timedelta(minutes=DEFAULT_WAKEUP_LEAD),
+            window=timedelta(minutes=DEFAULT_WAKEUP_WINDOW),
+        )
+        self._schedule_changed = False
+        self._phase_offset: Optional[timedelta] = None
+
+    def apply_phase(self, offset: timedelta) -> None:
+        """Delay the next scheduled refresh by `offset`; later refreshes keep that phase."""
+        self._phase_offset = offset if offset else None
+        if self._unsub_refresh is not None:
+            # Already scheduled (listeners present): re-arm with the offset now.
+            self._schedule_refresh()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        super()._schedule_refresh()
+        offset, self._phase_offset = self._phase_offset, None
+        if offset is None or self._unsub_refresh is None or not self.update_interval:
+            return
+        self._async_unsub_refresh()
+        self._unsub_refresh = async_call_later(self.hass, self.update_interval + offset, self._async_phase_refresh)
+
+    async def _async_phase_refresh(self, _now: datetime) -> None:
+        self._unsub_refresh = None
+        await self.async_refresh()
+
+    @property
+    def wakeup_schedule(self) -> Dict[str, Any]:
+        now = dt_util.utcnow()
+        return {
+            "adaptive": self.adaptive,
+            "update_interval_min": round(self.update_interval.total_seconds() / 60, 1)
+            if self.update_interval
+            else None,
+            "sources": self.wakeups.as_dict(now),
+        }
+
+    def _update_schedule(self, data: WateriusData, now: datetime) -> None:
+        changed = False
+        for sid, src in data.sources.items():
+            changed |= self.wakeups.observe(sid, src.last_wakeup)
+        self.wakeups.forget_missing(data.sources.keys())
+        if self.adaptive:
+            interval = self.wakeups.next_interval(now, self.base_interval, self.adaptive_max_interval)
+        else:
+            interval = self.base_interval
+        if interval != self.update_interval:
+            self.update_interval = interval
+            changed = True
+        self._schedule_changed |= changed
+
+    @callback
+    def async_reschedule(self) -> None:
+        """Re-arm the poll timer with the current update_interval, without fetching."""
+        if self._unsub_refresh is not None:
+            self._schedule_refresh()
+
+    def set_base_interval(self, interval: timedelta) -> bool:
+        """Retune polling in place (options change); returns True if the interval changed.
+
+        Call async_reschedule() to apply it to the pending refresh.
+        """
+        if interval == self.base_interval:
+            return False
+        self.base_interval = interval
+        if self.adaptive:
+            interval = self.wakeups.next_interval(dt_util.utcnow(), interval, self.adaptive_max_interval)
+        self.update_interval = interval
+        self._schedule_changed = True
+        return True
+
+    def _longest_poll_interval(self) -> timedelta:
+        # base_interval is the push reconcile interval when readings arrive by webhook.
+        if self.adaptive:
+            return max(self.base_interval, self.adaptive_max_interval)
+        return self.base_interval
+
+    @property
+    def effective_stale_after(self) -> timedelta:
+        """stale_after, stretched so that a regular poll gap never reads as stale."""
+        return max(self.stale_after, self._longest_poll_interval() * STALE_POLL_GAPS)
+
+    def is_fresh(self, updated_at: Optional[datetime]) -> bool:
+        return updated_at is not None and dt_util.utcnow() - updated_at <= self.effective_stale_after
+
+    def is_export_fresh(self, updated_at: Optional[datetime]) -> bool:
+        """Exports are refetched only once their tier is due, so they may be a whole tier older."""
+        max_age = self.effective_stale_after + self.tier_intervals[TIER_EXPORTS]
+        return updated_at is not None and dt_util.utcnow() - updated_at <= max_age
+
+    def _compute_stale_keys(self, data: Optional[WateriusData]) -> Set[ChangeKey]:
+        if data is None:
+            return set()
+        stale = {channel_key(cid) for cid, ch in data.channels_by_id.items() if not self.is_fresh(ch.updated_at)}
+        stale.update(export_key(eid) for eid, ex in data.exports_by_id.items() if not self.is_export_fresh(ex.updated_at))
+        return stale
+
+    @callback
+    def async_start_stale_timer(self) -> CALLBACK_TYPE:
+        """Re-check freshness periodically: listeners are not called while every poll fails."""
+        return async_track_time_interval(
+            self.hass, self._async_check_stale, timedelta(minutes=DEFAULT_STALE_CHECK_INTERVAL)
+        )
+
+    @callback
+    def _async_check_stale(self, now: datetime) -> None:
+        if self._compute_stale_keys(self.data) != self._stale_keys:
+            # Same data: only the items whose availability flipped are notified.
+            self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        new = self.data
+        old = self._notified_data
+        if old is None or new is None or self.last_update_success != self._notified_success:
+            self.changed_keys = None
+        elif new is old:
+            self.changed_keys = set()
+        else:
+            self.changed_keys = diff_data(old, new)
+        if self._schedule_changed and self.changed_keys is not None:
+            self.changed_keys.add(SCHEDULE_KEY)
+        self._schedule_changed = False
+
+        # Feed reading histories before entities read their derived values.
+        if self.series is not None and new is not None and new is not old:
+            changed = self.changed_keys
+            self.series.ingest(
+                ch
+                for cid, ch in new.channels_by_id.items()
+                if changed is None or channel_key(cid) in changed
             )
 
+        # Items whose own data crossed the staleness threshold change availability.
+        stale = self._compute_stale_keys(new)
+        if self.changed_keys is not None:
+            self.changed_keys |= stale ^ self._stale_keys
+        self._stale_keys = stale
+        self._notified_data = new
+        self._notified_success = self.last_update_success
+        super().async_update_listeners()
+
+    @callback
+    def async_add_keyed_listener(
+        self, update_callback: Callable[[], None], keys: Optional[Iterable[ChangeKey]]
+    ) -> CALLBACK_TYPE:
+        """Listen for updates that touch any of `keys` (None: every update)."""
+        if keys is None:
+            return self.async_add_listener(update_callback)
+        watched: FrozenSet[ChangeKey] = frozenset(keys)
+
+        @callback
+        def _filtered() -> None:
+            changed = self.changed_keys
+            if changed is None or not watched.isdisjoint(changed):
+                update_callback()
+            else:
+                self.suppressed_writes += 1
+
+        return self.async_add_listener(_filtered)
+
+    def _tier_due(self, tier: str, now: datetime) -> bool:
+        if tier in self._force_tiers:
+            return True
+        last = self._tier_fetched_at.get(tier)
+        if last is None:
+            return True
+        interval = self.tier_intervals.get(tier)
+        return interval is None or now - last >= interval
+
+    @property
+    def tier_state(self) -> Dict[str, Optional[str]]:
+        """Last fetch time of each refresh tier (ISO), for diagnostics."""
+        return {
+            tier: (ts.isoformat() if (ts := self._tier_fetched_at.get(tier)) else None)
+            for tier in (TIER_CHANNELS, TIER_REPORTS, TIER_EXPORTS)
+        }
+
+    async def async_restore_snapshot(self) -> bool:
+        """Publish the persisted snapshot as current data. Returns False if there is none."""
+        if self._snapshot_store is None:
+            return False
+        payload = await self._snapshot_store.async_load()
+        if payload is None:
+            return False
+        try:
+            data = WateriusData.from_dict(payload.get("data") or {})
+        except (KeyError, TypeError, ValueError):
+            self.logger.debug("Discarding unreadable Waterius snapshot")
+            return False
+
+        self.wakeups.load(payload.get("wakeups"))
+        for tier, ts in (payload.get("tiers") or {}).items():
+            parsed = dt_util.parse_datetime(ts) if isinstance(ts, str) else None
+            if parsed is not None:
+                self._tier_fetched_at[tier] = parsed
+
+        self.async_set_updated_data(data)
+        return True
+
+    def _snapshot_payload(self) -> Dict[str, Any]:
+        return {
+            "data": self.data.as_dict() if self.data is not None else {},
+            "tiers": {tier: ts.isoformat() for tier, ts in self._tier_fetched_at.items()},
+            "wakeups": self.wakeups.dump(),
+        }
+
+    async def async_request_full_refresh(self) -> None:
+        """Refresh now, treating every tier as due."""
+        self._force_tiers.update((TIER_REPORTS, TIER_EXPORTS))
+        await self.async_request_refresh()
+
+    async def _gather_bounded(
+        self, items: List[int], fetch: Callable[[int], Awaitable[Any]]
+    ) -> List[Any]:
+        """Run `fetch` for every item with at most `reports_concurrency` calls in flight.
+
+        Results are returned in the order of `items`. A failing item does not cancel
+        the others: its exception is returned in place of the result.
+        """
+        return await gather_bounded(items, fetch, self.reports_concurrency)
+
+    async def _fetch_uk_vals(self, channel_id: int) -> Dict[str, Any]:
+        rep_url = CHANNEL_REPORTS_URL_TEMPLATE.format(channel_id=channel_id)
+        return await async_extract_uk_period_values(self.api.iter_channel_reports(rep_url))
+
+    async def _fetch_uk_vals_bounded(self, channel_ids: List[int]) -> List[Any]:
+        return await self._gather_bounded(channel_ids, self._fetch_uk_vals)
+
+    async def _fetch_channel_detail(self, channel_id: int) -> ChannelRow:
+        detail = await self.api.fetch_channel_detail(CHANNEL_DETAIL_URL_TEMPLATE.format(channel_id=channel_id))
+        row = parse_channel_row(detail)
+        if row is None:
+            raise WateriusApiError(f"Unexpected channel {channel_id} payload: {type(detail)}")
+        return row
+
+    @staticmethod
+    def _build_channel(
+        row: ChannelRow,
+        source_id: int,
+        uk_vals: Any,
+        old: Optional[WateriusChannel],
+        now: datetime,
+    ) -> WateriusChannel:
+        """Channel record from a fresh row and its reports result (values or WateriusApiError).
+
+        Freshness follows the reading itself: a failed reports fetch only keeps the last
+        known report values and is recorded in `error`.
+        """
+        error: Optional[str] = None
+
+        if isinstance(uk_vals, BaseException):
+            if not isinstance(uk_vals, WateriusApiError):
+                raise uk_vals
+            error = str(uk_vals)
+            uk_vals = old.uk_vals if old else {}
+
+        return WateriusChannel.from_row(row, source_id, uk_vals, now, error)
+
+    @callback
+    def _async_publish_patch(
+        self,
+        *,
+        sources: Optional[Dict[int, WateriusSource]] = None,
+        channels: Optional[Dict[int, WateriusChannel]] = None,
+        exports: Optional[Dict[int, WateriusExport]] = None,
+    ) -> None:
+        """Replace individual items in the current data; listeners see only what changed.
+
+        Unlike async_set_updated_data this neither re-arms the poll timer nor touches
+        last_update_success: a partial update says nothing about the full crawl.
+        """
+        data = self.data
+        if data is None:
+            return
+        sources = sources or {}
+        channels = channels or {}
+        exports = exports or {}
+        self.data = WateriusData(
+            sources={sid: sources.get(sid, src) for sid, src in data.sources.items()},
+            channels_by_source={
+                sid: [channels.get(ch.channel_id, ch) for ch in chs]
+                for sid, chs in data.channels_by_source.items()
+            },
+            exports_by_source={
+                sid: {ex_id: exports.get(ex_id, ex) for ex_id, ex in exs.items()}
+                for sid, exs in data.exports_by_source.items()
+            },
+        )
+        self.async_update_listeners()
+        if self._snapshot_store is not None:
+            self._snapshot_store.async_schedule_save(self._snapshot_payload)
+
+    @callback
+    def async_apply_push(self, values_by_serial: Dict[str, Any]) -> List[int]:
+        """Patch channel values reported by a device directly; returns the matched channel ids."""
+        data = self.data
+        if data is None:
+            return []
+        now = dt_util.utcnow()
+        channels: Dict[int, WateriusChannel] = {}
+        sources: Dict[int, WateriusSource] = {}
+        for ch in data.channels_by_id.values():
+            serial = str(ch.serial or "").strip()
+            if not serial or serial not in values_by_serial:
+                continue
+            channels[ch.channel_id] = replace(ch, last_value=values_by_serial[serial], updated_at=now, error=None)
+            src = data.sources.get(ch.source_id)
+            if src is not None:
+                sources[src.source_id] = replace(src, last_wakeup=now.isoformat())
+        if channels:
+            self._async_publish_patch(sources=sources, channels=channels)
+        return list(channels)
+
+    async def async_refresh_channels(self, channel_ids: Iterable[int]) -> None:
+        """Refetch only the given channels (row + reports) and patch them into the current data."""
+        await self.async_refresh_targets(channel_ids=channel_ids)
+
+    async def async_refresh_targets(
+        self,
+        *,
+        channel_ids: Iterable[int] = (),
+        export_ids: Iterable[int] = (),
+        source_ids: Iterable[int] = (),
+    ) -> None:
+        """Refetch only the given items and patch them into the current data.
+
+        A source expands to its own row plus all of its channels and exports.
+        Listeners are notified once, and only for items whose data changed.
+        """
+        data = self.data
+        if data is None:
+            return
+        sids = [sid for sid in dict.fromkeys(source_ids) if sid in data.sources]
+        cids = dict.fromkeys(channel_ids)
+        eids = dict.fromkeys(export_ids)
+        for sid in sids:
+            cids.update(dict.fromkeys(ch.channel_id for ch in data.channels_by_source.get(sid, [])))
+            eids.update(dict.fromkeys(data.exports_by_source.get(sid, {})))
+        cid_list = [cid for cid in cids if cid in data.channels_by_id]
+        eid_list = [eid for eid in eids if eid in data.exports_by_id]
+        if not (sids or cid_list or eid_list):
+            return
+
+        now = dt_util.utcnow()
+        sources, channels, exports = await asyncio.gather(
+            self._refetch_sources(sids),
+            self._refetch_channels(cid_list, now),
+            self._refetch_exports(eid_list, now),
+        )
+        self._async_publish_patch(sources=sources, channels=channels, exports=exports)
+
+    async def _fetch_source_detail(self, source_id: int) -> SourceRow:
+        detail = await self.api.fetch_source_detail(SOURCE_DETAIL_URL_TEMPLATE.format(source_id=source_id))
+        row = parse_source_row(detail)
+        if row is None:
+            raise WateriusApiError(f"Unexpected source {source_id} payload: {type(detail)}")
+        return row
+
+    async def _refetch_sources(self, source_ids: List[int]) -> Dict[int, WateriusSource]:
+        if not source_ids:
+            return {}
+        rows = await self._gather_bounded(source_ids, self._fetch_source_detail)
+
+        patched: Dict[int, WateriusSource] = {}
+        for source_id, row in zip(source_ids, rows):
+            if isinstance(row, BaseException):
+                if not isinstance(row, WateriusApiError):
+                    raise row
+                self.logger.debug("Waterius source %s refresh failed: %s", source_id, row)
+                continue
+            patched[source_id] = WateriusSource.from_row(row)
+        return patched
+
+    async def _refetch_channels(self, ids: List[int], now: datetime) -> Dict[int, WateriusChannel]:
+        if not ids:
+            return {}
+
+        async def _fetch(channel_id: int) -> Tuple[ChannelRow, Any]:
+            # Row and reports share one concurrency slot per channel.
+            row = await self._fetch_channel_detail(channel_id)
+            try:
+                uk_vals: Any = await self._fetch_uk_vals(channel_id)
+            except WateriusApiError as e:
+                uk_vals = e
+            return row, uk_vals
+
+        results = await self._gather_bounded(ids, _fetch)
+
+        patched: Dict[int, WateriusChannel] = {}
+        for channel_id, result in zip(ids, results):
+            old = self.data.channels_by_id.get(channel_id)
+            if old is None:
+                continue
+            if isinstance(result, BaseException):
+                if not isinstance(result, WateriusApiError):
+                    raise result
+                patched[channel_id] = replace(old, error=str(result))
+                continue
+            row, uk_vals = result
+            patched[channel_id] = self._build_channel(row, old.source_id, uk_vals, old, now)
+        return patched
+
+    async def _fetch_export_detail(self, export_id: int) -> ExportRow:
+        detail = await self.api.fetch_export_detail(EXPORT_DETAIL_URL_TEMPLATE.format(export_id=export_id))
+        return parse_export_row(detail)
+
+    async def _refetch_exports(self, ids: List[int], now: datetime) -> Dict[int, WateriusExport]:
+        if not ids:
+            return {}
+        rows = await self._gather_bounded(ids, self._fetch_export_detail)
+
+        patched: Dict[int, WateriusExport] = {}
+        for export_id, row in zip(ids, rows):
+            old = self.data.exports_by_id.get(export_id)
+            if old is None:
+                continue
+            if isinstance(row, BaseException):
+                if not isinstance(row, WateriusApiError):
+                    raise row
+                patched[export_id] = replace(old, error=str(row))
+                continue
+            patched[export_id] = WateriusExport.from_row(export_id, row, updated_at=now)
+        return patched
+
+    async def _async_update_data(self) -> WateriusData:
+        now = dt_util.utcnow()
+        reports_due = self._tier_due(TIER_REPORTS, now)
+        exports_due = self._tier_due(TIER_EXPORTS, now)
+        prev = self.data
+        prev_channels = prev.channels_by_id if prev is not None else {}
+        prev_exports = prev.exports_by_id if prev is not None else {}
+        metrics = self.api.metrics
+        started = phase_started = time.monotonic()
+        try:
+            source_rows = await self.api.fetch_source_rows(SOURCES_URL)
+            metrics.record_phase(PHASE_SOURCES, time.monotonic() - phase_started)
+            phase_started = time.monotonic()
+            channel_rows = await self.api.fetch_channel_rows(CHANNELS_URL)
+            metrics.record_phase(PHASE_CHANNELS, time.monotonic() - phase_started)
         except WateriusApiError as e:
             raise UpdateFailed(str(e)) from e
+
+        sources = {row.source_id: WateriusSource.from_row(row) for row in source_rows}
+
+        channels_by_source: Dict[int, List[WateriusChannel]] = {}
+        pending = [row for row in channel_rows if row.source_id is not None]
+        export_ids_all = {row.export_id for row in pending if row.export_id is not None}
+
+        # Reports: refetch everything when the tier is due, otherwise only channels
+        # we have never seen or whose last fetch failed.
+        to_fetch = []
+        for row in pending:
+            old = prev_channels.get(row.channel_id)
+            if reports_due or old is None or old.error is not None:
+                to_fetch.append(row.channel_id)
+        phase_started = time.monotonic()
+        uk_vals_all = await self._fetch_uk_vals_bounded(to_fetch)
+        fetched = dict(zip(to_fetch, uk_vals_all))
+        metrics.record_phase(PHASE_REPORTS, time.monotonic() - phase_started)
+
+        failures = 0
+        for row in pending:
+            old = prev_channels.get(row.channel_id)
+            channel = self._build_channel(
+                row, row.source_id, fetched.get(row.channel_id, old.uk_vals if old else {}), old, now
+            )
+            if channel.error is not None:
+                failures += 1
+            channels_by_source.setdefault(row.source_id, []).append(channel)
+
+        for sid in sources.keys():
+            channels_by_source.setdefault(sid, [])
+
+        phase_started = time.monotonic()
+        exports_by_id: Dict[int, WateriusExport] = {}
+        for ex_id in sorted(export_ids_all):
+            old_ex = prev_exports.get(ex_id)
+            if not exports_due and old_ex is not None and old_ex.error is None:
+                # Not fetched: keep the real fetch time (see is_export_fresh).
+                exports_by_id[ex_id] = old_ex
+                continue
+            detail_url = EXPORT_DETAIL_URL_TEMPLATE.format(export_id=ex_id)
+            try:
+                detail = await self.api.fetch_export_detail(detail_url)
+            except WateriusApiError as e:
+                failures += 1
+                exports_by_id[ex_id] = (
+                    replace(old_ex, error=str(e)) if old_ex else WateriusExport(export_id=ex_id, error=str(e))
+                )
+                continue
+            exports_by_id[ex_id] = WateriusExport.from_row(ex_id, parse_export_row(detail), updated_at=now)
+        metrics.record_phase(PHASE_EXPORTS, time.monotonic() - phase_started)
+
+        exports_by_source: Dict[int, Dict[int, WateriusExport]] = {}
+        for sid, chs in channels_by_source.items():
+            ex_ids = {ch.export_id for ch in chs if ch.export_id is not None}
+            if ex_ids:
+                exports_by_source[sid] = {ex_id: exports_by_id[ex_id] for ex_id in ex_ids}
+
+        if failures:
+            self.logger.warning("Waterius refresh: %s channel/export fetches failed, kept last known values", failures)
+
+        self._tier_fetched_at[TIER_CHANNELS] = now
+        if reports_due:
+            self._tier_fetched_at[TIER_REPORTS] = now
+            self._force_tiers.discard(TIER_REPORTS)
+        if exports_due:
+            self._tier_fetched_at[TIER_EXPORTS] = now
+            self._force_tiers.discard(TIER_EXPORTS)
+
+        data = WateriusData(
+            sources=sources,
+            channels_by_source=channels_by_source,
+            exports_by_source=exports_by_source,
+        )
+        self._update_schedule(data, now)
+        if self._snapshot_store is not None:
+            self._snapshot_store.async_schedule_save(self._snapshot_payload)
+        metrics.record_phase(PHASE_TOTAL, time.monotonic() - started)
+        return data
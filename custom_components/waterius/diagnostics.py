@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .api import WateriusApiError
+from .const import DOMAIN, CONF_TOKEN, CONF_WEBHOOK_ID, CHANNELS_URL, SOURCES_URL
+
+TO_REDACT = {CONF_TOKEN, CONF_WEBHOOK_ID, "user_contact", "title4", "email", "serial"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    outbox = entry_data.get("outbox")
+    statistics = entry_data.get("statistics")
+    push = entry_data.get("push")
+    api = coordinator.api
+    data = coordinator.data
+
+    items: Dict[str, Any] = {}
+    if data is not None:
+        items = {
+            "channels": {
+                str(cid): {
+                    "updated_at": ch.updated_at.isoformat() if ch.updated_at else None,
+                    "error": ch.error,
+                }
+                for cid, ch in data.channels_by_id.items()
+            },
+            "exports": {
+                str(eid): {
+                    "updated_at": ex.updated_at.isoformat() if ex.updated_at else None,
+                    "error": ex.error,
+                }
+                for eid, ex in data.exports_by_id.items()
+            },
+        }
+
+    # Raw API payloads are not kept in memory; fetch them only when diagnostics are requested.
+    try:
+        raw: Dict[str, Any] = {
+            "sources": await api.fetch_sources(SOURCES_URL),
+            "channels": await api.fetch_channels(CHANNELS_URL),
+        }
+    except WateriusApiError as e:
+        raw = {"error": str(e)}
+
+    return {
+        "entry": async_redact_data({"data": dict(entry.data), "options": dict(entry.options)}, TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval_s": coordinator.update_interval.total_seconds() if coordinator.update_interval else None,
+            "tiers": coordinator.tier_state,
+            "wakeup_schedule": coordinator.wakeup_schedule,
+            "suppressed_writes": coordinator.suppressed_writes,
+        },
+        "performance": api.metrics.as_dict(),
+        "transport": api.transport_state,
+        "http_cache": api.cache_stats,
+        "outbox": {
+            "length": outbox.length,
+            "oldest_queued_at": outbox.oldest_queued_at.isoformat() if outbox.oldest_queued_at else None,
+            "sent": outbox.sent,
+            "dropped": outbox.dropped,
+            "last_error": outbox.last_error,
+        }
+        if outbox is not None
+        else None,
+        "statistics": {
+            "imported": statistics.imported,
+            "last_error": statistics.last_error,
+            "cursors": {str(cid): cursor for cid, cursor in statistics.cursors.items()},
+        }
+        if statistics is not None
+        else None,
+        "push": push.as_dict() if push is not None else None,
+        "series": (
+            {
+                str(cid): {"points": len(series), "last": series.last}
+                for cid, series in coordinator.series.series.items()
+            }
+            if coordinator.series is not None
+            else None
+        ),
+        "items": items,
+        "data": async_redact_data(data.as_dict(), TO_REDACT) if data is not None else None,
+        "raw": async_redact_data(raw, TO_REDACT),
+    }
@@ -1,50 +1,23 @@
 from __future__ import annotations
 
+from contextlib import aclosing
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
-
-def extract_source_id(channel_raw: Dict[str, Any]) -> Optional[int]:
-    v = channel_raw.get("source")
-    if isinstance(v, int):
-        return v
-    if isinstance(v, str) and v.strip().isdigit():
-        return int(v.strip())
-    return None
+from .ingest import ReportRow
 
 
-def extract_export_id(channel_raw: Dict[str, Any]) -> Optional[int]:
-    v = channel_raw.get("export")
-    if isinstance(v, int):
-        return v
-    if isinstance(v, str) and v.strip().isdigit():
-        return int(v.strip())
+def match_uk_period_report(r: ReportRow) -> Optional[Dict[str, Any]]:
+    if r.sent:
+        return {
+            "prev_period_value": r.uk_read_value,
+            "curr_period_value": r.uk_send_value,
+            "timestamp": r.timestamp,
+        }
     return None
 
 
-def _get(raw: Dict[str, Any], *keys: str, default: Any = None) -> Any:
-    for k in keys:
-        if k in raw:
-            return raw.get(k)
-    return default
-
-
-def extract_uk_period_values(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
-    for r in reports:
-        st = (r.get("status_text") or "").strip().lower()
-        if st == "ошибка ук":
-            continue
-        if st == "отправлено":
-            return {
-                "prev_period_value": r.get("uk_read_value"),
-                "curr_period_value": r.get("uk_send_value"),
-                "timestamp": r.get("timestamp"),
-            }
-
-    ts = None
-    if reports and isinstance(reports[0], dict):
-        ts = reports[0].get("timestamp")
-
+def uk_period_error_values(ts: Any) -> Dict[str, Any]:
     return {
         "prev_period_value": "ошибка УК",
         "curr_period_value": "ошибка УК",
@@ -52,13 +25,31 @@ def extract_uk_period_values(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
-def build_channel_attrs(ch_raw: Dict[str, Any], uk_vals: Dict[str, Any]) -> Dict[str, Any]:
+async def async_extract_uk_period_values(reports: AsyncIterator[ReportRow]) -> Dict[str, Any]:
+    """UK period values from the newest sent report; stops consuming the stream there."""
+    ts = None
+    first = True
+    async with aclosing(reports) as it:
+        async for r in it:
+            if first:
+                ts = r.timestamp
+                first = False
+            vals = match_uk_period_report(r)
+            if vals is not None:
+                return vals
+
+    return uk_period_error_values(ts)
+
+
+def build_channel_attrs(ch: Any) -> Dict[str, Any]:
+    """Channel attributes from a parsed channel record (WateriusChannel)."""
+    uk_vals = ch.uk_vals
     attrs: Dict[str, Any] = {
-        "Серийный номер": _get(ch_raw, "serial"),
-        "Статус отчёта": _get(ch_raw, "report_status", "reportStatus"),
-        "Дата поверки": _get(ch_raw, "service_date", "serviceDate"),
+        "Серийный номер": ch.serial,
+        "Статус отчёта": ch.report_status,
+        "Дата поверки": ch.service_date,
     }
-    warnings = _get(ch_raw, "warnings")
+    warnings = ch.warnings
     if warnings:
         attrs["Предупреждения"] = warnings
 
@@ -85,21 +76,6 @@ def normalize_tarif_ended(raw: str) -> str:
         return raw
 
 
-def compute_days_left(raw: str) -> Optional[int]:
-    raw = (raw or "").strip()
-    if not raw:
-        return None
-    try:
-        if "T" in raw:
-            dt_due = datetime.fromisoformat(raw.replace("Z", "+00:00"))
-        else:
-            dt_due = datetime.strptime(raw, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        now_utc = datetime.now(timezone.utc)
-        return (dt_due.date() - now_utc.date()).days
-    except Exception:
-        return None
-
-
 def parse_personal_account(title4: Any) -> str:
     s = str(title4 or "").strip()
     return s.replace("Лицевой счёт:", "").strip()
@@ -0,0 +1,127 @@
+"""Per-endpoint extractors mapping decoded API rows straight to typed tuples.
+
+Only the fields the integration reads are pulled out; key lookups and aliases
+are resolved once here instead of at every use site.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+REPORT_STATUS_SENT = "отправлено"
+
+
+class SourceRow(NamedTuple):
+    source_id: int
+    name: str
+    last_wakeup: Any
+
+
+class ChannelRow(NamedTuple):
+    channel_id: int
+    source_id: Optional[int]
+    export_id: Optional[int]
+    data_type: Any
+    serial: Any
+    report_status: Any
+    service_date: Any
+    warnings: Any
+    last_value: Any
+
+
+class ExportRow(NamedTuple):
+    tarif_ended: str
+    title2: Any
+    title4: Any
+    send_date_description: Any
+    user_contact: Any
+
+
+class ReportRow(NamedTuple):
+    timestamp: Any
+    sent: bool
+    value: Any
+    uk_read_value: Any
+    uk_send_value: Any
+
+
+def to_int(v: Any) -> Optional[int]:
+    if type(v) is int:
+        return v
+    if isinstance(v, str):
+        v = v.strip()
+        if v.isdigit():
+            return int(v)
+    return None
+
+
+def _first_of(*keys: str) -> Callable[[Dict[str, Any]], Any]:
+    """Getter for the first present key (present-but-None wins, like dict.get chains)."""
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda raw: raw.get(key)
+
+    def _get(raw: Dict[str, Any]) -> Any:
+        for k in keys:
+            if k in raw:
+                return raw[k]
+        return None
+
+    return _get
+
+
+_report_status = _first_of("report_status", "reportStatus")
+_service_date = _first_of("service_date", "serviceDate")
+_last_value = _first_of("last_value", "value", "last")
+
+
+def parse_source_row(raw: Any) -> Optional[SourceRow]:
+    if not isinstance(raw, dict):
+        return None
+    source_id = to_int(raw.get("id"))
+    if source_id is None:
+        return None
+    name = str(raw.get("name") or "").strip()
+    return SourceRow(source_id, name or f"Source {source_id}", raw.get("last_wakeup"))
+
+
+def parse_channel_row(raw: Any) -> Optional[ChannelRow]:
+    if not isinstance(raw, dict):
+        return None
+    channel_id = to_int(raw.get("id"))
+    if channel_id is None:
+        return None
+    return ChannelRow(
+        channel_id,
+        to_int(raw.get("source")),
+        to_int(raw.get("export")),
+        raw.get("data_type"),
+        raw.get("serial"),
+        _report_status(raw),
+        _service_date(raw),
+        raw.get("warnings"),
+        _last_value(raw),
+    )
+
+
+def parse_export_row(raw: Any) -> ExportRow:
+    if not isinstance(raw, dict):
+        return ExportRow("", None, None, None, None)
+    return ExportRow(
+        (raw.get("tarif_ended") or "").strip(),
+        raw.get("title2"),
+        raw.get("title4"),
+        raw.get("send_date_description"),
+        raw.get("user_contact"),
+    )
+
+
+def parse_report_row(raw: Any) -> Optional[ReportRow]:
+    if not isinstance(raw, dict):
+        return None
+    return ReportRow(
+        raw.get("timestamp"),
+        (raw.get("status_text") or "").strip().lower() == REPORT_STATUS_SENT,
+        raw.get("value"),
+        raw.get("uk_read_value"),
+        raw.get("uk_send_value"),
+    )
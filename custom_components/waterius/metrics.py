@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+# Latency bucket upper bounds, milliseconds (last bucket is open-ended).
+LATENCY_BUCKETS_MS: List[float] = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+ENDPOINT_SOURCES = "sources"
+ENDPOINT_CHANNELS = "channels"
+ENDPOINT_CHANNEL_DETAIL = "channel_detail"
+ENDPOINT_CHANNEL_REPORTS = "channel_reports"
+ENDPOINT_EXPORTS = "exports"
+ENDPOINT_EXPORT_DETAIL = "export_detail"
+ENDPOINT_OTHER = "other"
+
+# Coordinator refresh phases.
+PHASE_SOURCES = "sources"
+PHASE_CHANNELS = "channels"
+PHASE_REPORTS = "reports"
+PHASE_EXPORTS = "exports"
+PHASE_TOTAL = "total"
+
+
+def endpoint_class(url: str) -> str:
+    """Map a request URL to its endpoint class (ids stripped)."""
+    parts = [p for p in urlsplit(url).path.split("/") if p]
+    if parts[:1] != ["api"] or len(parts) < 2:
+        return ENDPOINT_OTHER
+    if parts[1] == "source":
+        return ENDPOINT_SOURCES
+    if parts[1] == "export":
+        return ENDPOINT_EXPORTS if len(parts) == 2 else ENDPOINT_EXPORT_DETAIL
+    if parts[1] == "channel":
+        if len(parts) == 2:
+            return ENDPOINT_CHANNELS
+        if len(parts) >= 4 and parts[3] == "reports":
+            return ENDPOINT_CHANNEL_REPORTS
+        return ENDPOINT_CHANNEL_DETAIL
+    return ENDPOINT_OTHER
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram; quantiles are interpolated inside the bucket."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for idx, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = LATENCY_BUCKETS_MS[idx - 1] if idx > 0 else 0.0
+                upper = LATENCY_BUCKETS_MS[idx] if idx < len(LATENCY_BUCKETS_MS) else self.max_ms
+                return round(lower + (upper - lower) * (rank - seen) / n, 1)
+            seen += n
+        return round(self.max_ms, 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class EndpointStats:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes = 0
+        self.not_modified = 0
+        self.latency = LatencyHistogram()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "not_modified": self.not_modified,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class WateriusMetrics:
+    """Per-endpoint request stats and refresh phase durations for one config entry."""
+
+    def __init__(self) -> None:
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.phases: Dict[str, LatencyHistogram] = {}
+        self.last_phases: Dict[str, float] = {}
+
+    def _endpoint(self, url: str) -> EndpointStats:
+        cls = endpoint_class(url)
+        stats = self.endpoints.get(cls)
+        if stats is None:
+            stats = self.endpoints[cls] = EndpointStats()
+        return stats
+
+    def record_request(
+        self, url: str, seconds: float, size: int = 0, *, error: bool = False, not_modified: bool = False
+    ) -> None:
+        stats = self._endpoint(url)
+        stats.requests += 1
+        stats.bytes += size
+        stats.latency.observe(seconds * 1000)
+        if error:
+            stats.errors += 1
+        if not_modified:
+            stats.not_modified += 1
+
+    def record_retry(self, url: str) -> None:
+        self._endpoint(url).retries += 1
+
+    def record_phase(self, phase: str, seconds: float) -> None:
+        hist = self.phases.get(phase)
+        if hist is None:
+            hist = self.phases[phase] = LatencyHistogram()
+        hist.observe(seconds * 1000)
+        self.last_phases[phase] = round(seconds * 1000, 1)
+
+    def endpoint_stats(self, cls: str) -> Optional[Dict[str, Any]]:
+        stats = self.endpoints.get(cls)
+        return stats.as_dict() if stats else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "endpoints": {cls: stats.as_dict() for cls, stats in self.endpoints.items()},
+            "phases": {phase: hist.as_dict() for phase, hist in self.phases.items()},
+            "last_refresh_ms": dict(self.last_phases),
+        }
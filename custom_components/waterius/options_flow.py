@@ -4,26 +4,54 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.core import callback
+from homeassistant.helpers.network import NoURLAvailableError
 
-from .const import CONF_TOKEN
+from .const import DOMAIN, CONF_TOKEN
+
+
+# HA >= 2024.11 provides OptionsFlow.config_entry (and forbids setting it); older cores do not.
+_LEGACY_CONFIG_ENTRY = not hasattr(config_entries.OptionsFlow, "config_entry")
 
 
 class WateriusOptionsFlowHandler(config_entries.OptionsFlow):
+    """Token and scan interval (minutes); applied live by the entry's update listener."""
+
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
-        self.config_entry = config_entry
+        if _LEGACY_CONFIG_ENTRY:
+            self.config_entry = config_entry
 
     async def async_step_init(self, user_input=None):
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            token = user_input[CONF_TOKEN].strip()
+            if not token:
+                return self.async_show_form(
+                    step_id="init", data_schema=self._schema(), errors={"base": "invalid_token"}
+                )
+            return self.async_create_entry(title="", data={**user_input, CONF_TOKEN: token})
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self._schema(),
+            description_placeholders={"webhook_url": self._webhook_url()},
+        )
 
-        token = self.config_entry.options.get(CONF_TOKEN, self.config_entry.data.get(CONF_TOKEN, ""))
-        scan = self.config_entry.options.get(CONF_SCAN_INTERVAL, self.config_entry.data.get(CONF_SCAN_INTERVAL))
+    def _webhook_url(self) -> str:
+        push = (self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id) or {}).get("push")
+        if push is None:
+            return "не используется"
+        try:
+            return push.url
+        except NoURLAvailableError:
+            return f"/api/webhook/{push.webhook_id}"
 
-        schema = vol.Schema(
+    def _schema(self) -> vol.Schema:
+        token = self.config_entry.options.get(CONF_TOKEN, self.config_entry.data.get(CONF_TOKEN, ""))
+        scan = self.config_entry.options.get(CONF_SCAN_INTERVAL, self.config_entry.data.get(CONF_SCAN_INTERVAL, 15))
+        return vol.Schema(
             {
                 vol.Required(CONF_TOKEN, default=token): str,
-                vol.Required(CONF_SCAN_INTERVAL, default=scan): vol.All(int, vol.Range(min=10, max=86400)),
+                vol.Required(CONF_SCAN_INTERVAL, default=scan): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=24 * 60)
+                ),
             }
         )
-        return self.async_show_form(step_id="init", data_schema=schema)
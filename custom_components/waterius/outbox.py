@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import WateriusApi, WateriusApiError, WateriusCircuitOpenError, WateriusHttpError, WateriusTransportError
+from .const import (
+    DOMAIN,
+    CHANNEL_SEND_URL_TEMPLATE,
+    DEFAULT_SEND_CONCURRENCY,
+    DEFAULT_OUTBOX_BATCH_SIZE,
+    DEFAULT_OUTBOX_BACKOFF_BASE,
+    DEFAULT_OUTBOX_BACKOFF_MAX,
+)
+from .scheduler import gather_bounded
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 1  # seconds
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store[Dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.outbox")
+
+
+async def async_remove_outbox(hass: HomeAssistant, entry_id: str) -> None:
+    await _store(hass, entry_id).async_remove()
+
+
+def is_retryable_send_error(err: WateriusApiError) -> bool:
+    """Errors worth queuing for later: the API was unreachable or overloaded."""
+    if isinstance(err, (WateriusTransportError, WateriusCircuitOpenError)):
+        return True
+    return isinstance(err, WateriusHttpError) and (err.status == 429 or err.status >= 500)
+
+
+class WateriusOutbox:
+    """Persistent queue of reading submissions that could not be sent.
+
+    Holds at most one pending value per channel (the latest wins) and flushes in
+    batches from a background task, backing off while the API stays unreachable.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        api: WateriusApi,
+        on_sent: Callable[[List[int]], Awaitable[None]],
+    ) -> None:
+        self._store = _store(hass, entry_id)
+        self._api = api
+        self._on_sent = on_sent
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._wakeup = asyncio.Event()
+        self._listeners: List[Callable[[], None]] = []
+        self._backoff = DEFAULT_OUTBOX_BACKOFF_BASE
+
+        self.sent = 0
+        self.dropped = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def length(self) -> int:
+        return len(self._pending)
+
+    @property
+    def oldest_queued_at(self) -> Optional[datetime]:
+        oldest = min((item["queued_at"] for item in self._pending.values()), default=None)
+        return dt_util.parse_datetime(oldest) if oldest else None
+
+    @property
+    def pending(self) -> Dict[int, Dict[str, Any]]:
+        return dict(self._pending)
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load()
+        for key, item in ((data or {}).get("pending") or {}).items():
+            try:
+                self._pending[int(key)] = dict(item)
+            except (TypeError, ValueError):
+                continue
+        if self._pending:
+            self._wakeup.set()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def _async_changed(self) -> None:
+        self._store.async_delay_save(
+            lambda: {"pending": {str(k): v for k, v in self._pending.items()}}, SAVE_DELAY
+        )
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_enqueue(self, channel_id: int, value: Any, error: Optional[str] = None) -> None:
+        """Queue a reading, replacing any older pending value for the channel."""
+        self._pending.pop(channel_id, None)
+        self._pending[channel_id] = {
+            "value": value,
+            "queued_at": dt_util.utcnow().isoformat(),
+            "attempts": 0,
+            "last_error": error,
+        }
+        self._async_changed()
+        self._wakeup.set()
+
+    @callback
+    def async_discard(self, channel_id: int) -> None:
+        """Drop a pending value superseded by a successful direct submission."""
+        if self._pending.pop(channel_id, None) is not None:
+            self._async_changed()
+
+    async def _async_flush_batch(self) -> bool:
+        """Send the oldest batch; returns False if the API is still unreachable."""
+        batch = sorted(self._pending.items(), key=lambda kv: kv[1]["queued_at"])[:DEFAULT_OUTBOX_BATCH_SIZE]
+        sent: List[int] = []
+        reachable = True
+
+        async def _send(channel_id: int, item: Dict[str, Any]) -> None:
+            nonlocal reachable
+            try:
+                await self._api.send_reading(CHANNEL_SEND_URL_TEMPLATE.format(channel_id=channel_id), item["value"])
+            except WateriusApiError as e:
+                self.last_error = str(e)
+                if self._pending.get(channel_id) is not item:
+                    return
+                if is_retryable_send_error(e):
+                    reachable = False
+                    item["attempts"] += 1
+                    item["last_error"] = str(e)
+                else:
+                    # Rejected by the API: retrying the same value will not help.
+                    self._pending.pop(channel_id, None)
+                    self.dropped += 1
+                return
+            # A newer value may have been queued meanwhile; keep it.
+            if self._pending.get(channel_id) is item:
+                self._pending.pop(channel_id, None)
+            self.sent += 1
+            sent.append(channel_id)
+
+        await gather_bounded(batch, lambda kv: _send(*kv), DEFAULT_SEND_CONCURRENCY, return_exceptions=False)
+        self._async_changed()
+        if sent:
+            await self._on_sent(sent)
+        return reachable
+
+    async def async_run(self) -> None:
+        """Background flush loop; runs until the config entry is unloaded."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                if await self._async_flush_batch():
+                    self._backoff = DEFAULT_OUTBOX_BACKOFF_BASE
+                    continue
+                await asyncio.sleep(self._backoff * random.uniform(0.8, 1.2))
+                self._backoff = min(DEFAULT_OUTBOX_BACKOFF_MAX, self._backoff * 2)
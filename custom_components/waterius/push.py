@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterable, Optional
+
+from aiohttp import web
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, CONF_WEBHOOK_ID
+from .coordinator import WateriusCoordinator
+
+# Waterius firmware reports each input as chN (meter value) with its serialN.
+_CHANNEL_KEY = re.compile(r"^ch(\d+)$")
+
+# Anyone on the LAN can POST serials: remember only this many unknown ones.
+MAX_UNKNOWN_SERIALS = 32
+
+
+def parse_device_payload(payload: Dict[str, Any]) -> Dict[str, float]:
+    """Map serial -> meter value from a device JSON payload."""
+    values: Dict[str, float] = {}
+    for key, value in payload.items():
+        m = _CHANNEL_KEY.match(key)
+        if m is None:
+            continue
+        serial = str(payload.get(f"serial{m.group(1)}") or "").strip()
+        if not serial:
+            continue
+        try:
+            values[serial] = float(str(value).replace(",", "."))
+        except (TypeError, ValueError):
+            continue
+    return values
+
+
+class WateriusPushReceiver:
+    """Webhook endpoint the devices POST their readings to."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator: WateriusCoordinator) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self.webhook_id: str = entry.data[CONF_WEBHOOK_ID]
+
+        self.received = 0
+        self.matched = 0
+        self.last_received_at: Optional[str] = None
+        self.unknown_serials: set[str] = set()
+
+    @property
+    def url(self) -> str:
+        return webhook.async_generate_url(self._hass, self.webhook_id)
+
+    def register(self) -> None:
+        webhook.async_register(
+            self._hass,
+            DOMAIN,
+            "Waterius",
+            self.webhook_id,
+            self._async_handle,
+            allowed_methods=["POST"],
+            local_only=True,
+        )
+
+    def unregister(self) -> None:
+        webhook.async_unregister(self._hass, self.webhook_id)
+
+    async def _async_handle(self, hass: HomeAssistant, webhook_id: str, request: web.Request) -> web.Response:
+        try:
+            payload = await request.json()
+        except ValueError:
+            return web.Response(status=400, text="invalid json")
+        if not isinstance(payload, dict):
+            return web.Response(status=400, text="expected an object")
+
+        self.received += 1
+        self.last_received_at = dt_util.utcnow().isoformat()
+        values = parse_device_payload(payload)
+        matched = self._coordinator.async_apply_push(values)
+        self.matched += len(matched)
+        if len(matched) < len(values) and self._coordinator.data is not None:
+            channels = self._coordinator.data.channels_by_id
+            seen = {str(channels[cid].serial).strip() for cid in matched}
+            self._track_unknown(serial for serial in values if serial not in seen)
+        return web.Response(status=200, text="ok")
+
+    def _track_unknown(self, serials: Iterable[str]) -> None:
+        for serial in serials:
+            if len(self.unknown_serials) >= MAX_UNKNOWN_SERIALS:
+                return
+            self.unknown_serials.add(serial)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "received": self.received,
+            "matched": self.matched,
+            "last_received_at": self.last_received_at,
+            # Serials identify meters: report how many, not which.
+            "unknown_serials": len(self.unknown_serials),
+        }
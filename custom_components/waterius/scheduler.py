@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, TypeVar
+
+from .const import DEFAULT_RATE_LIMIT, DEFAULT_RATE_BURST
+
+# Golden-ratio spacing spreads any number of entries evenly over the interval.
+_PHASE_STEP = 0.6180339887
+
+
+_T = TypeVar("_T")
+
+
+async def gather_bounded(
+    items: Iterable[_T],
+    fn: Callable[[_T], Awaitable[Any]],
+    limit: int,
+    *,
+    return_exceptions: bool = True,
+) -> List[Any]:
+    """Run `fn` for every item with at most `limit` calls in flight; results keep the item order.
+
+    With `return_exceptions` a failing item does not cancel the others: its exception
+    is returned in place of the result.
+    """
+    sem = asyncio.Semaphore(max(1, limit))
+
+    async def _one(item: _T) -> Any:
+        async with sem:
+            return await fn(item)
+
+    return await asyncio.gather(*(_one(item) for item in items), return_exceptions=return_exceptions)
+
+
+class _LeaderCancelled(Exception):
+    """The task running a shared request was cancelled; followers run it themselves."""
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = max(0.01, float(rate))
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        # The lock keeps waiters FIFO; only its holder sleeps for the next token.
+        async with self.lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class WateriusRequestScheduler:
+    """Process-wide request budget shared by every Waterius config entry.
+
+    - token bucket per host (`rate` requests/s, bursts up to `burst`);
+    - single-flight: identical in-flight GETs share one request;
+    - refresh phase offsets so entries with the same interval do not fire together.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE_LIMIT, burst: int = DEFAULT_RATE_BURST) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._entries: List[str] = []
+
+        self.requests = 0
+        self.coalesced = 0
+        self.queue_depth = 0
+        self.queue_depth_max = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "queue_depth": self.queue_depth,
+            "queue_depth_max": self.queue_depth_max,
+            "wait_avg_ms": round(1000 * self.wait_total / self.requests, 1) if self.requests else 0.0,
+            "wait_max_ms": round(1000 * self.wait_max, 1),
+            "entries": len(self._entries),
+        }
+
+    async def acquire(self, host: str) -> None:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _TokenBucket(self.rate, self.burst)
+        self.queue_depth += 1
+        self.queue_depth_max = max(self.queue_depth_max, self.queue_depth)
+        started = time.monotonic()
+        try:
+            await bucket.acquire()
+        finally:
+            self.queue_depth -= 1
+        waited = time.monotonic() - started
+        self.requests += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+    async def single_flight(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `factory()` unless an identical request is already in flight; share its result."""
+        while (fut := self._inflight.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(fut)
+            except _LeaderCancelled:
+                # Only the leader was cancelled, not us: take over (or join the next leader).
+                continue
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await factory()
+        except BaseException as e:
+            fut.set_exception(_LeaderCancelled() if isinstance(e, asyncio.CancelledError) else e)
+            # Mark as retrieved when nobody else was waiting.
+            fut.exception()
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def register_entry(self, entry_id: str) -> None:
+        if entry_id not in self._entries:
+            self._entries.append(entry_id)
+
+    def unregister_entry(self, entry_id: str) -> None:
+        if entry_id in self._entries:
+            self._entries.remove(entry_id)
+
+    def phase_offset(self, entry_id: str, interval: Optional[timedelta]) -> timedelta:
+        """Deterministic offset within `interval` for this entry's refreshes (0 for the first)."""
+        if not interval or entry_id not in self._entries:
+            return timedelta(0)
+        index = self._entries.index(entry_id)
+        return interval * ((index * _PHASE_STEP) % 1.0)
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from homeassistant.util import dt as dt_util
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_time_change,
+    async_track_utc_time_change,
+)
 
 from .const import (
     DOMAIN,
@@ -16,11 +22,40 @@ from .const import (
     DATA_TYPE_DEVICE_CLASS,
     DATA_TYPE_UNIT,
     DATA_TYPE_STATE_CLASS,
+    DATA_TYPE_FLOW_UNIT,
+    DATA_TYPE_FLOW_DEVICE_CLASS,
     DEVICE_CLASS_TITLES,
     HA_DEVICE_MANUFACTURER,
     HA_DEVICE_MODEL,
 )
-from .helpers import build_channel_attrs, normalize_tarif_ended, compute_days_left, parse_personal_account
+from .coordinator import (
+    SCHEDULE_KEY,
+    STRUCTURE_KEY,
+    ChangeKey,
+    channel_key,
+    export_key,
+    source_key,
+    touched_source_ids,
+)
+from .helpers import build_channel_attrs, normalize_tarif_ended, parse_personal_account
+from .metrics import (
+    ENDPOINT_CHANNELS,
+    ENDPOINT_CHANNEL_REPORTS,
+    ENDPOINT_EXPORT_DETAIL,
+    ENDPOINT_SOURCES,
+    PHASE_TOTAL,
+)
+from .timeseries import PERIOD_DAY, PERIOD_MONTH, PERIOD_WEEK, PERIODS, period_start
+
+_MISSING = object()
+
+PERIOD_NAMES = {
+    PERIOD_DAY: "расход за сутки",
+    PERIOD_WEEK: "расход за неделю",
+    PERIOD_MONTH: "расход за месяц",
+}
+
+PERF_ENDPOINTS = (ENDPOINT_SOURCES, ENDPOINT_CHANNELS, ENDPOINT_CHANNEL_REPORTS, ENDPOINT_EXPORT_DETAIL)
 
 
 async def async_setup_entry(
@@ -30,26 +65,65 @@ async def async_setup_entry(
 ):
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
+    outbox = hass.data[DOMAIN][entry.entry_id].get("outbox")
+
     entities: list[SensorEntity] = [WateriusSummarySensor(entry, coordinator)]
+    if outbox is not None:
+        entities.append(WateriusOutboxLengthSensor(entry, coordinator, outbox))
+        entities.append(WateriusOutboxOldestSensor(entry, coordinator, outbox))
+    entities.append(WateriusRefreshDurationSensor(entry, coordinator))
+    for endpoint in PERF_ENDPOINTS:
+        entities.append(WateriusEndpointLatencySensor(entry, coordinator, endpoint))
+
+    known: Set[Tuple[Any, ...]] = set()
+    entities.extend(_new_item_entities(entry, coordinator, known))
+    async_add_entities(entities, update_before_add=False)
+
+    @callback
+    def _reconcile() -> None:
+        # Channels/exports that disappear go unavailable on their own (see `available`);
+        # devices of vanished sources can then be deleted from the UI.
+        new = _new_item_entities(entry, coordinator, known, coordinator.changed_keys)
+        if new:
+            async_add_entities(new)
 
-    # sources теперь: Dict[id, raw_source_dict]
-    for source_id, source in (coordinator.data.sources or {}).items():
-        channels = coordinator.data.channels_by_source.get(source_id, [])
+    entry.async_on_unload(coordinator.async_add_keyed_listener(_reconcile, (STRUCTURE_KEY,)))
 
-        if isinstance(source, dict):
-            source_name = str(source.get("name") or "").strip() or f"Source {source_id}"
-        else:
-            source_name = str(source or "").strip() or f"Source {source_id}"
+
+def _new_item_entities(
+    entry: ConfigEntry,
+    coordinator,
+    known: Set[Tuple[Any, ...]],
+    changed: Optional[Set[ChangeKey]] = None,
+) -> List[SensorEntity]:
+    """Channel/export entities for items of the current data not in `known` (which is updated).
+
+    With a change set only the sources it touches are scanned; None scans everything.
+    """
+    data = coordinator.data
+    if data is None:
+        return []
+    source_ids = data.sources.keys() if changed is None else touched_source_ids(data, changed)
+    entities: List[SensorEntity] = []
+    for source_id in source_ids:
+        src = data.sources[source_id]
+        channels = data.channels_by_source.get(source_id, [])
+        exports = (data.exports_by_source or {}).get(source_id, {})
+        new_channels = [ch for ch in channels if ("channel", ch.channel_id) not in known]
+        new_exports = [ex_id for ex_id in sorted(exports.keys()) if ("export", source_id, ex_id) not in known]
+        if not new_channels and not new_exports:
+            continue
+        source_name = src.name
 
         group_dc: Optional[str] = None
         for ch in channels:
-            dt = ch.raw.get("data_type")
-            dc = DATA_TYPE_DEVICE_CLASS.get(dt)
+            dc = DATA_TYPE_DEVICE_CLASS.get(ch.data_type)
             if dc:
                 group_dc = dc
                 break
 
-        for ch in channels:
+        for ch in new_channels:
+            known.add(("channel", ch.channel_id))
             entities.append(
                 WateriusChannelSensor(
                     entry,
@@ -60,9 +134,15 @@ async def async_setup_entry(
                     group_device_class=group_dc,
                 )
             )
-
-        exports = (coordinator.data.exports_by_source or {}).get(source_id, {})
-        for export_id in sorted(exports.keys()):
+            if coordinator.series is not None and ch.data_type in DATA_TYPE_UNIT:
+                for period in PERIODS:
+                    entities.append(
+                        WateriusConsumptionSensor(entry, coordinator, source_id=source_id, channel=ch, period=period)
+                    )
+                entities.append(WateriusFlowRateSensor(entry, coordinator, source_id=source_id, channel=ch))
+
+        for export_id in new_exports:
+            known.add(("export", source_id, export_id))
             entities.append(
                 WateriusExportDiagnosticSensor(
                     entry,
@@ -73,8 +153,7 @@ async def async_setup_entry(
                     group_device_class=group_dc,
                 )
             )
-
-    async_add_entities(entities, update_before_add=False)
+    return entities
 
 
 class _BaseWateriusEntity(SensorEntity):
@@ -82,8 +161,18 @@ class _BaseWateriusEntity(SensorEntity):
         self._entry = entry
         self._coordinator = coordinator
 
+    def _listen_keys(self) -> Optional[Iterable[ChangeKey]]:
+        """Change-set keys this entity depends on; None means every update."""
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self.async_write_ha_state()
+
     async def async_added_to_hass(self) -> None:
-        self.async_on_remove(self._coordinator.async_add_listener(self.async_write_ha_state))
+        self.async_on_remove(
+            self._coordinator.async_add_keyed_listener(self._handle_coordinator_update, self._listen_keys())
+        )
 
 
 class WateriusSummarySensor(_BaseWateriusEntity):
@@ -95,6 +184,9 @@ class WateriusSummarySensor(_BaseWateriusEntity):
         super().__init__(entry, coordinator)
         self._attr_unique_id = f"{entry.entry_id}_summary"
 
+    def _listen_keys(self) -> Optional[Iterable[ChangeKey]]:
+        return (STRUCTURE_KEY, SCHEDULE_KEY)
+
     @property
     def native_value(self) -> int:
         return len(self._coordinator.data.sources or {})
@@ -107,9 +199,113 @@ class WateriusSummarySensor(_BaseWateriusEntity):
             "sources_count": len(self._coordinator.data.sources or {}),
             "channels_count": channels_total,
             "exports_count": exports_total,
+            "wakeup_schedule": self._coordinator.wakeup_schedule,
         }
 
 
+class _BaseWateriusOutboxSensor(_BaseWateriusEntity):
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, entry: ConfigEntry, coordinator, outbox) -> None:
+        super().__init__(entry, coordinator)
+        self._outbox = outbox
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(self._outbox.async_add_listener(self.async_write_ha_state))
+
+
+class WateriusOutboxLengthSensor(_BaseWateriusOutboxSensor):
+    _attr_name = "Outbox queue"
+    _attr_icon = "mdi:tray-full"
+
+    def __init__(self, entry: ConfigEntry, coordinator, outbox) -> None:
+        super().__init__(entry, coordinator, outbox)
+        self._attr_unique_id = f"{entry.entry_id}_outbox_length"
+
+    @property
+    def native_value(self) -> int:
+        return self._outbox.length
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return {
+            "pending": {str(cid): item["value"] for cid, item in self._outbox.pending.items()},
+            "sent": self._outbox.sent,
+            "dropped": self._outbox.dropped,
+            "last_error": self._outbox.last_error,
+        }
+
+
+class WateriusOutboxOldestSensor(_BaseWateriusOutboxSensor):
+    _attr_name = "Outbox oldest"
+    _attr_icon = "mdi:tray-alert"
+    _attr_device_class = "timestamp"
+
+    def __init__(self, entry: ConfigEntry, coordinator, outbox) -> None:
+        super().__init__(entry, coordinator, outbox)
+        self._attr_unique_id = f"{entry.entry_id}_outbox_oldest"
+
+    @property
+    def native_value(self):
+        """Queue time of the oldest pending reading (its age is now - this)."""
+        return self._outbox.oldest_queued_at
+
+
+class WateriusRefreshDurationSensor(_BaseWateriusEntity):
+    """Duration of the last coordinator refresh, with per-phase breakdown."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Refresh duration"
+    _attr_icon = "mdi:timer-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = "ms"
+    _attr_state_class = "measurement"
+
+    def __init__(self, entry: ConfigEntry, coordinator) -> None:
+        super().__init__(entry, coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_perf_refresh_duration"
+
+    @property
+    def native_value(self) -> Optional[float]:
+        return self._coordinator.api.metrics.last_phases.get(PHASE_TOTAL)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return {"phases_ms": dict(self._coordinator.api.metrics.last_phases)}
+
+
+class WateriusEndpointLatencySensor(_BaseWateriusEntity):
+    """p95 latency of one endpoint class; request/error/retry/byte counters as attributes."""
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:speedometer"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = "ms"
+    _attr_state_class = "measurement"
+
+    def __init__(self, entry: ConfigEntry, coordinator, endpoint: str) -> None:
+        super().__init__(entry, coordinator)
+        self._endpoint = endpoint
+        self._attr_name = f"API {endpoint} p95"
+        self._attr_unique_id = f"{entry.entry_id}_perf_{endpoint}_p95"
+
+    @property
+    def native_value(self) -> Optional[float]:
+        stats = self._coordinator.api.metrics.endpoint_stats(self._endpoint)
+        return stats["latency"]["p95_ms"] if stats else None
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        stats = self._coordinator.api.metrics.endpoint_stats(self._endpoint)
+        if not stats:
+            return {}
+        latency = stats.pop("latency")
+        return {**stats, **latency}
+
+
 class WateriusChannelSensor(_BaseWateriusEntity):
     _attr_has_entity_name = True
     _attr_icon = "mdi:counter"
@@ -131,10 +327,11 @@ class WateriusChannelSensor(_BaseWateriusEntity):
         self._group_device_class = group_device_class
 
         self._attr_unique_id = f"{entry.entry_id}_source_{source_id}_channel_{channel_id}"
+        self._attrs_key = ("channel_attrs", channel_id)
 
         ch = self._find_channel()
-        dt = (ch.raw.get("data_type") if ch else None)
-        serial = (ch.raw.get("serial") if ch else None)
+        dt = ch.data_type if ch else None
+        serial = ch.serial if ch else None
         dt_name = DATA_TYPE_NAMES.get(dt, f"Data type {dt}")
         self._attr_name = f"{dt_name} ({serial})" if serial else f"{dt_name} (channel {channel_id})"
 
@@ -145,11 +342,20 @@ class WateriusChannelSensor(_BaseWateriusEntity):
         if dt in DATA_TYPE_STATE_CLASS:
             self._attr_state_class = DATA_TYPE_STATE_CLASS[dt]
 
+    def _listen_keys(self) -> Optional[Iterable[ChangeKey]]:
+        return (channel_key(self._channel_id), source_key(self._source_id))
+
     def _find_channel(self):
-        for ch in self._coordinator.data.channels_by_source.get(self._source_id, []):
-            if ch.channel_id == self._channel_id:
-                return ch
-        return None
+        return self._coordinator.data.channels_by_id.get(self._channel_id)
+
+    @property
+    def available(self) -> bool:
+        ch = self._find_channel()
+        return ch is not None and self._coordinator.is_fresh(ch.updated_at)
+
+    def _last_wakeup(self) -> Any:
+        src = self._coordinator.data.sources.get(self._source_id)
+        return src.last_wakeup if src else None
 
     @property
     def device_info(self):
@@ -168,24 +374,154 @@ class WateriusChannelSensor(_BaseWateriusEntity):
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
+        memo = self._coordinator.data.memo
+        attrs = memo.get(self._attrs_key)
+        if attrs is None:
+            attrs = memo[self._attrs_key] = self._build_attrs()
+        return attrs
+
+    def _build_attrs(self) -> Dict[str, Any]:
         ch = self._find_channel()
         if not ch:
             return {}
-        attrs = build_channel_attrs(ch.raw, ch.uk_vals)
+        attrs = build_channel_attrs(ch)
 
-        try:
-            sources = getattr(self._coordinator.data, "sources", {}) or {}
-            src = sources.get(self._source_id)
-            if isinstance(src, dict):
-                lw = src.get("last_wakeup")
-                if lw:
-                    attrs["Передача в Ватериус"] = lw
-        except Exception:
-            pass
+        lw = self._last_wakeup()
+        if lw:
+            attrs["Передача в Ватериус"] = lw
+        if ch.error:
+            attrs["Ошибка обновления"] = ch.error
 
         return attrs
 
 
+class _BaseWateriusSeriesSensor(_BaseWateriusEntity):
+    """Value derived from a channel's reading history (see timeseries.ChannelSeries)."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        coordinator,
+        *,
+        source_id: int,
+        channel,
+    ) -> None:
+        super().__init__(entry, coordinator)
+        self._source_id = source_id
+        self._channel_id = channel.channel_id
+        dt = channel.data_type
+        dt_name = DATA_TYPE_NAMES.get(dt, f"Data type {dt}")
+        label = channel.serial or f"channel {channel.channel_id}"
+        self._base_name = f"{dt_name} ({label})"
+        self._data_type = dt
+
+    def _listen_keys(self) -> Optional[Iterable[ChangeKey]]:
+        return (channel_key(self._channel_id),)
+
+    def _series(self):
+        return self._coordinator.series.get(self._channel_id)
+
+    @property
+    def available(self) -> bool:
+        # Same rules as the channel sensor: the channel must still exist and be fresh.
+        ch = self._coordinator.data.channels_by_id.get(self._channel_id)
+        return ch is not None and self._coordinator.is_fresh(ch.updated_at) and self._series() is not None
+
+    @property
+    def device_info(self):
+        return {"identifiers": {(DOMAIN, f"source_{self._source_id}")}}
+
+
+class WateriusConsumptionSensor(_BaseWateriusSeriesSensor):
+    _attr_icon = "mdi:chart-bar"
+    _attr_state_class = "total"
+
+    def __init__(self, entry: ConfigEntry, coordinator, *, period: str, **kwargs: Any) -> None:
+        super().__init__(entry, coordinator, **kwargs)
+        self._period = period
+        self._attr_name = f"{self._base_name} {PERIOD_NAMES[period]}"
+        self._attr_unique_id = f"{entry.entry_id}_channel_{self._channel_id}_consumption_{period}"
+        self._attr_device_class = DATA_TYPE_DEVICE_CLASS.get(self._data_type)
+        self._attr_native_unit_of_measurement = DATA_TYPE_UNIT.get(self._data_type)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+
+        @callback
+        def _new_day(now: datetime) -> None:
+            # The period may have rolled over without a new reading.
+            self.async_write_ha_state()
+
+        self.async_on_remove(async_track_time_change(self.hass, _new_day, hour=0, minute=0, second=1))
+
+    @property
+    def native_value(self) -> Optional[float]:
+        series = self._series()
+        if series is None:
+            return None
+        value = series.consumption(self._period, dt_util.utcnow().timestamp())
+        return round(value, 3) if value is not None else None
+
+    @property
+    def last_reset(self) -> Optional[datetime]:
+        return dt_util.utc_from_timestamp(period_start(self._period, dt_util.utcnow().timestamp()))
+
+
+class WateriusFlowRateSensor(_BaseWateriusSeriesSensor):
+    _attr_icon = "mdi:speedometer"
+    _attr_state_class = "measurement"
+
+    def __init__(self, entry: ConfigEntry, coordinator, **kwargs: Any) -> None:
+        super().__init__(entry, coordinator, **kwargs)
+        self._attr_name = f"{self._base_name} расход в час"
+        self._attr_unique_id = f"{entry.entry_id}_channel_{self._channel_id}_flow_rate"
+        self._attr_device_class = DATA_TYPE_FLOW_DEVICE_CLASS.get(self._data_type)
+        self._attr_native_unit_of_measurement = DATA_TYPE_FLOW_UNIT.get(self._data_type)
+        self._unsub_expiry: Optional[CALLBACK_TYPE] = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._cancel_expiry)
+        self._schedule_expiry()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._schedule_expiry()
+        self.async_write_ha_state()
+
+    @callback
+    def _cancel_expiry(self) -> None:
+        if self._unsub_expiry is not None:
+            self._unsub_expiry()
+            self._unsub_expiry = None
+
+    @callback
+    def _schedule_expiry(self) -> None:
+        """Write state again when the current rate lapses (no reading may ever arrive to do it)."""
+        self._cancel_expiry()
+        series = self._series()
+        expires = series.flow_expires_at if series is not None else None
+        if expires is None or expires <= dt_util.utcnow().timestamp():
+            return
+
+        @callback
+        def _expired(now: datetime) -> None:
+            self._unsub_expiry = None
+            self.async_write_ha_state()
+
+        self._unsub_expiry = async_track_point_in_utc_time(self.hass, _expired, dt_util.utc_from_timestamp(expires))
+
+    @property
+    def native_value(self) -> Optional[float]:
+        series = self._series()
+        if series is None:
+            return None
+        rate = series.flow_rate_at(dt_util.utcnow().timestamp())
+        return round(rate, 4) if rate is not None else None
+
+
 class WateriusExportDiagnosticSensor(_BaseWateriusEntity):
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -209,6 +545,8 @@ class WateriusExportDiagnosticSensor(_BaseWateriusEntity):
         self._export_id = export_id
         self._group_device_class = group_device_class
         self._attr_unique_id = f"{entry.entry_id}_source_{source_id}_export_{export_id}_diag"
+        self._due_key = ("export_due", export_id)
+        self._attrs_key = ("export_attrs", source_id, export_id)
 
     @property
     def device_info(self):
@@ -220,16 +558,39 @@ class WateriusExportDiagnosticSensor(_BaseWateriusEntity):
             "model": HA_DEVICE_MODEL,
         }
 
-    def _find_export_raw(self) -> Optional[Dict[str, Any]]:
-        ex = (self._coordinator.data.exports_by_source or {}).get(self._source_id, {}).get(self._export_id)
-        return ex.raw if ex else None
+    def _listen_keys(self) -> Optional[Iterable[ChangeKey]]:
+        return (export_key(self._export_id), source_key(self._source_id))
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+
+        @callback
+        def _new_day(now: datetime) -> None:
+            # "Дней до оплаты" counts from the UTC date; no export update may arrive to refresh it.
+            self.async_write_ha_state()
+
+        self.async_on_remove(async_track_utc_time_change(self.hass, _new_day, hour=0, minute=0, second=1))
+
+    def _find_export(self):
+        return self._coordinator.data.exports_by_id.get(self._export_id)
+
+    @property
+    def available(self) -> bool:
+        ex = self._find_export()
+        return ex is not None and self._coordinator.is_export_fresh(ex.updated_at)
 
     @property
     def native_value(self):
         """Return due date as timezone-aware datetime for device_class=timestamp."""
-        raw = self._find_export_raw() or {}
-        tarif_raw = (raw.get("tarif_ended") or "").strip()
-        norm = normalize_tarif_ended(tarif_raw)
+        memo = self._coordinator.data.memo
+        due = memo.get(self._due_key, _MISSING)
+        if due is _MISSING:
+            due = memo[self._due_key] = self._parse_due()
+        return due
+
+    def _parse_due(self) -> Optional[datetime]:
+        ex = self._find_export()
+        norm = normalize_tarif_ended(ex.tarif_ended if ex else "")
         if not norm:
             return None
         try:
@@ -244,27 +605,31 @@ class WateriusExportDiagnosticSensor(_BaseWateriusEntity):
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
-        raw = self._find_export_raw() or {}
-        tarif_raw = (raw.get("tarif_ended") or "").strip()
-        days_left = compute_days_left(tarif_raw)
-        personal_account = parse_personal_account(raw.get("title4"))
-
-        last_wakeup = None
-        try:
-            sources = getattr(self._coordinator.data, "sources", {}) or {}
-            src = sources.get(self._source_id)
-            if isinstance(src, dict):
-                last_wakeup = src.get("last_wakeup")
-        except Exception:
-            pass
+        # "Дней до оплаты" depends on today's date: rebuild when the day changes.
+        today = dt_util.utcnow().date()
+        memo = self._coordinator.data.memo
+        cached = memo.get(self._attrs_key)
+        if cached is None or cached[0] != today:
+            cached = memo[self._attrs_key] = (today, self._build_attrs(today))
+        return cached[1]
+
+    def _build_attrs(self, today: date) -> Dict[str, Any]:
+        ex = self._find_export()
+        if ex is None:
+            return {}
+        due = self.native_value
+        src = self._coordinator.data.sources.get(self._source_id)
+        last_wakeup = src.last_wakeup if src else None
 
         attrs: Dict[str, Any] = {
             "Название устройства": self._source_name,
-            "УК": raw.get("title2"),
-            "Лицевой счёт": personal_account,
-            "Дата отправки": raw.get("send_date_description"),
-            "Телефон пользователя": raw.get("user_contact"),
-            "Дней до оплаты": days_left,
+            "УК": ex.title2,
+            "Лицевой счёт": parse_personal_account(ex.title4),
+            "Дата отправки": ex.send_date_description,
+            "Телефон пользователя": ex.user_contact,
+            "Дней до оплаты": (due.date() - today).days if due is not None else None,
             "Передача в Ватериус": last_wakeup,
         }
+        if ex.error:
+            attrs["Ошибка обновления"] = ex.error
         return attrs
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .api import WateriusApiError
+from .const import (
+    DOMAIN,
+    SERVICE_SEND_READING,
+    SERVICE_SEND_ALL,
+    SERVICE_REFRESH,
+    CHANNEL_SEND_URL_TEMPLATE,
+    DEFAULT_SEND_CONCURRENCY,
+)
+from .coordinator import WateriusCoordinator
+from .outbox import WateriusOutbox, is_retryable_send_error
+from .scheduler import gather_bounded
+
+ATTR_CHANNEL_ID = "channel_id"
+ATTR_CHANNEL_IDS = "channel_ids"
+ATTR_VALUE = "value"
+ATTR_READINGS = "readings"
+ATTR_SOURCE_ID = "source_id"
+ATTR_EXPORT_ID = "export_id"
+
+SEND_READING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CHANNEL_ID): vol.Coerce(int),
+        vol.Required(ATTR_VALUE): vol.Coerce(float),
+    }
+)
+
+SEND_ALL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CHANNEL_IDS): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+        vol.Optional(ATTR_READINGS): vol.All(
+            cv.ensure_list,
+            [vol.Schema({vol.Required(ATTR_CHANNEL_ID): vol.Coerce(int), vol.Required(ATTR_VALUE): vol.Coerce(float)})],
+        ),
+    }
+)
+
+
+REFRESH_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CHANNEL_ID): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+            vol.Optional(ATTR_SOURCE_ID): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+            vol.Optional(ATTR_EXPORT_ID): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_CHANNEL_ID, ATTR_SOURCE_ID, ATTR_EXPORT_ID),
+)
+
+
+def _entries(hass: HomeAssistant) -> List[Dict[str, Any]]:
+    return [v for v in hass.data.get(DOMAIN, {}).values() if isinstance(v, dict) and "coordinator" in v]
+
+
+def _coordinators(hass: HomeAssistant) -> List[WateriusCoordinator]:
+    return [v["coordinator"] for v in _entries(hass)]
+
+
+def _entry_for_channel(hass: HomeAssistant, channel_id: int) -> Optional[Dict[str, Any]]:
+    for entry_data in _entries(hass):
+        coordinator = entry_data["coordinator"]
+        if coordinator.data is not None and channel_id in coordinator.data.channels_by_id:
+            return entry_data
+    return None
+
+
+def _coordinator_for_channel(hass: HomeAssistant, channel_id: int) -> Optional[WateriusCoordinator]:
+    entry_data = _entry_for_channel(hass, channel_id)
+    return entry_data["coordinator"] if entry_data else None
+
+
+async def async_send_readings(
+    hass: HomeAssistant, readings: List[Tuple[int, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """POST readings with bounded concurrency; returns a per-channel result.
+
+    Readings that fail because the API is unreachable are queued in the entry's
+    outbox (result `queued: true`). Afterwards only the touched channels are
+    refreshed, per owning config entry.
+    """
+    readings = list(dict(readings).items())  # one submission per channel, the last value wins
+    results: Dict[str, Dict[str, Any]] = {}
+    touched: Dict[WateriusCoordinator, List[int]] = {}
+
+    async def _send(channel_id: int, value: Any) -> None:
+        entry_data = _entry_for_channel(hass, channel_id)
+        if entry_data is None:
+            results[str(channel_id)] = {"success": False, "queued": False, "error": "unknown channel"}
+            return
+        if value is None:
+            results[str(channel_id)] = {"success": False, "queued": False, "error": "no value"}
+            return
+        coordinator: WateriusCoordinator = entry_data["coordinator"]
+        outbox: Optional[WateriusOutbox] = entry_data.get("outbox")
+        try:
+            await coordinator.api.send_reading(CHANNEL_SEND_URL_TEMPLATE.format(channel_id=channel_id), value)
+        except WateriusApiError as e:
+            queued = outbox is not None and is_retryable_send_error(e)
+            if queued:
+                outbox.async_enqueue(channel_id, value, str(e))
+            results[str(channel_id)] = {"success": False, "queued": queued, "error": str(e)}
+            return
+        if outbox is not None:
+            outbox.async_discard(channel_id)
+        results[str(channel_id)] = {"success": True, "queued": False, "error": None}
+        touched.setdefault(coordinator, []).append(channel_id)
+
+    await gather_bounded(readings, lambda r: _send(*r), DEFAULT_SEND_CONCURRENCY, return_exceptions=False)
+
+    for coordinator, channel_ids in touched.items():
+        await coordinator.async_refresh_channels(channel_ids)
+
+    return {str(cid): results[str(cid)] for cid, _ in readings}
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    if hass.services.has_service(DOMAIN, SERVICE_SEND_READING):
+        return
+
+    async def _handle_send_reading(call: ServiceCall) -> ServiceResponse:
+        channel_id = call.data[ATTR_CHANNEL_ID]
+        if _coordinator_for_channel(hass, channel_id) is None:
+            raise ServiceValidationError(f"Unknown Waterius channel {channel_id}")
+        results = await async_send_readings(hass, [(channel_id, call.data[ATTR_VALUE])])
+        result = results[str(channel_id)]
+        if not result["success"] and not result["queued"]:
+            raise HomeAssistantError(f"Failed to send reading for channel {channel_id}: {result['error']}")
+        return {"results": results}
+
+    async def _handle_send_all(call: ServiceCall) -> ServiceResponse:
+        if ATTR_READINGS in call.data:
+            readings = [(r[ATTR_CHANNEL_ID], r[ATTR_VALUE]) for r in call.data[ATTR_READINGS]]
+        else:
+            wanted = set(call.data.get(ATTR_CHANNEL_IDS) or [])
+            readings = []
+            for coordinator in _coordinators(hass):
+                if coordinator.data is None:
+                    continue
+                for channel_id, ch in coordinator.data.channels_by_id.items():
+                    if not wanted or channel_id in wanted:
+                        readings.append((channel_id, ch.last_value))
+        results = await async_send_readings(hass, readings)
+        return {
+            "sent": sum(1 for r in results.values() if r["success"]),
+            "queued": sum(1 for r in results.values() if r["queued"]),
+            "failed": sum(1 for r in results.values() if not r["success"] and not r["queued"]),
+            "results": results,
+        }
+
+    async def _handle_refresh(call: ServiceCall) -> None:
+        channel_ids = set(call.data.get(ATTR_CHANNEL_ID) or [])
+        source_ids = set(call.data.get(ATTR_SOURCE_ID) or [])
+        export_ids = set(call.data.get(ATTR_EXPORT_ID) or [])
+        targets = []
+        for coordinator in _coordinators(hass):
+            data = coordinator.data
+            if data is None:
+                continue
+            cids = channel_ids & data.channels_by_id.keys()
+            sids = source_ids & data.sources.keys()
+            eids = export_ids & data.exports_by_id.keys()
+            if cids or sids or eids:
+                targets.append(
+                    coordinator.async_refresh_targets(channel_ids=cids, source_ids=sids, export_ids=eids)
+                )
+        if not targets:
+            raise ServiceValidationError("No matching Waterius channel, source or export")
+        await asyncio.gather(*targets)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_READING,
+        _handle_send_reading,
+        schema=SEND_READING_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_ALL,
+        _handle_send_all,
+        schema=SEND_ALL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH, _handle_refresh, schema=REFRESH_SCHEMA)
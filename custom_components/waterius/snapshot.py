@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+
+# Bump whenever the serialized WateriusData layout changes: older snapshots are discarded.
+SNAPSHOT_SCHEMA = 3
+SNAPSHOT_MAX_AGE = timedelta(days=7)
+SNAPSHOT_SAVE_DELAY = 10  # seconds
+
+
+class WateriusSnapshotStore:
+    """Persists the last coordinator snapshot so entities can be restored at startup."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[Dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+
+    async def async_load(self) -> Optional[Dict[str, Any]]:
+        """Return the stored snapshot, or None if missing, from another schema or too old."""
+        try:
+            payload = await self._store.async_load()
+        except Exception:
+            return None
+        if not isinstance(payload, dict):
+            return None
+        if payload.get("schema") != SNAPSHOT_SCHEMA:
+            return None
+
+        saved_at = dt_util.parse_datetime(str(payload.get("saved_at") or ""))
+        if saved_at is None or dt_util.utcnow() - saved_at > SNAPSHOT_MAX_AGE:
+            return None
+        return payload
+
+    def async_schedule_save(self, data_func: Callable[[], Dict[str, Any]]) -> None:
+        def _payload() -> Dict[str, Any]:
+            return {
+                "schema": SNAPSHOT_SCHEMA,
+                "saved_at": dt_util.utcnow().isoformat(),
+                **data_func(),
+            }
+
+        self._store.async_delay_save(_payload, SNAPSHOT_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
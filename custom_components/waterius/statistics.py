@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import WateriusApi, WateriusApiError
+from .const import (
+    DOMAIN,
+    CHANNEL_REPORTS_URL_TEMPLATE,
+    DATA_TYPE_NAMES,
+    DATA_TYPE_UNIT,
+    DEFAULT_REPORTS_CONCURRENCY,
+)
+from .ingest import ReportRow
+from .scheduler import gather_bounded
+
+try:  # HA >= 2025.4; older cores only know has_mean.
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # pragma: no cover
+    StatisticMeanType = None  # type: ignore[assignment,misc]
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10  # seconds
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store[Dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.statistics")
+
+
+async def async_remove_statistics_cursors(hass: HomeAssistant, entry_id: str) -> None:
+    await _store(hass, entry_id).async_remove()
+
+
+def statistic_id(channel_id: int) -> str:
+    return f"{DOMAIN}:channel_{channel_id}"
+
+
+def parse_report_reading(r: ReportRow) -> Optional[Tuple[datetime, float]]:
+    """(timestamp, meter value) of a report, or None if either is missing."""
+    ts = dt_util.parse_datetime(str(r.timestamp or ""))
+    value = r.value if r.value is not None else r.uk_send_value
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    if ts is None:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=dt_util.UTC)
+    return ts, value
+
+
+class WateriusStatisticsImporter:
+    """Imports channel report history into recorder long-term statistics.
+
+    The first run backfills the whole history in one call per channel. Later runs
+    read reports only until the persisted per-channel cursor and append the new
+    hours. Reports come from the API newest first.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, api: WateriusApi) -> None:
+        self._hass = hass
+        self._store = _store(hass, entry_id)
+        self._api = api
+        # channel_id -> {"last_ts": iso, "last_value": float, "sum": float}
+        self._cursors: Dict[int, Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+
+        self.imported = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def cursors(self) -> Dict[int, Dict[str, Any]]:
+        return dict(self._cursors)
+
+    def has_cursor(self, channel_id: int) -> bool:
+        return channel_id in self._cursors
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load()
+        for key, cursor in ((data or {}).get("cursors") or {}).items():
+            try:
+                self._cursors[int(key)] = dict(cursor)
+            except (TypeError, ValueError):
+                continue
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(
+            lambda: {"cursors": {str(k): v for k, v in self._cursors.items()}}, SAVE_DELAY
+        )
+
+    async def _read_new(self, channel_id: int, since: Optional[datetime]) -> List[Tuple[datetime, float]]:
+        """Readings newer than `since`, oldest first; stops paging at the cursor."""
+        readings: List[Tuple[datetime, float]] = []
+        url = CHANNEL_REPORTS_URL_TEMPLATE.format(channel_id=channel_id)
+        if since is None:
+            # Backfill needs every page anyway: fetch them in parallel.
+            readings = [x for r in await self._api.fetch_channel_report_rows(url) if (x := parse_report_reading(r))]
+            readings.sort(key=lambda x: x[0])
+            return readings
+        async with aclosing(self._api.iter_channel_reports(url)) as it:
+            async for r in it:
+                reading = parse_report_reading(r)
+                if reading is None:
+                    continue
+                if reading[0] <= since:
+                    break
+                readings.append(reading)
+        readings.sort(key=lambda x: x[0])
+        return readings
+
+    def _build_rows(self, channel_id: int, readings: List[Tuple[datetime, float]]) -> List[StatisticData]:
+        """Hourly rows (last reading of each hour); advances the channel cursor."""
+        cursor = self._cursors.get(channel_id) or {}
+        total = float(cursor.get("sum", 0.0))
+        prev = cursor.get("last_value")
+        hours: Dict[datetime, StatisticData] = {}
+        for ts, value in readings:
+            # A decreasing value means a meter replacement/reset: no negative consumption.
+            if prev is not None and value >= prev:
+                total += value - prev
+            prev = value
+            start = ts.replace(minute=0, second=0, microsecond=0)
+            hours[start] = StatisticData(start=start, state=value, sum=total)
+        self._cursors[channel_id] = {"last_ts": readings[-1][0].isoformat(), "last_value": prev, "sum": total}
+        return list(hours.values())
+
+    @staticmethod
+    def _metadata(channel: Any) -> StatisticMetaData:
+        name = DATA_TYPE_NAMES.get(channel.data_type, f"Data type {channel.data_type}")
+        label = channel.serial or f"channel {channel.channel_id}"
+        meta: Dict[str, Any] = {
+            "has_sum": True,
+            "name": f"Ватериус {name} ({label})",
+            "source": DOMAIN,
+            "statistic_id": statistic_id(channel.channel_id),
+            "unit_of_measurement": DATA_TYPE_UNIT.get(channel.data_type),
+        }
+        if StatisticMeanType is not None:
+            meta["mean_type"] = StatisticMeanType.NONE
+        else:
+            meta["has_mean"] = False
+        return meta  # type: ignore[return-value]
+
+    async def _import_channel(self, channel: Any) -> None:
+        cursor = self._cursors.get(channel.channel_id)
+        since = dt_util.parse_datetime(cursor["last_ts"]) if cursor and cursor.get("last_ts") else None
+        readings = await self._read_new(channel.channel_id, since)
+        if not readings:
+            if cursor is None:
+                # Checked, nothing to import yet: don't backfill again on every update.
+                self._cursors[channel.channel_id] = {"last_ts": None, "last_value": None, "sum": 0.0}
+            return
+        rows = self._build_rows(channel.channel_id, readings)
+        async_add_external_statistics(self._hass, self._metadata(channel), rows)
+        self.imported += len(rows)
+
+    async def async_import(self, channels: Iterable[Any]) -> None:
+        """Import new history for `channels` (WateriusChannel records)."""
+        async with self._lock:
+
+            async def _one(channel: Any) -> None:
+                try:
+                    await self._import_channel(channel)
+                except WateriusApiError as e:
+                    self.last_error = str(e)
+
+            await gather_bounded(channels, _one, DEFAULT_REPORTS_CONCURRENCY, return_exceptions=False)
+            self._schedule_save()
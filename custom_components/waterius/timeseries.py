@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import base64
+import sys
+from array import array
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    DEFAULT_SERIES_RAW_RETENTION,
+    DEFAULT_SERIES_HOURLY_RETENTION,
+    DEFAULT_SERIES_DAILY_RETENTION,
+)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60  # seconds
+
+PERIOD_DAY = "day"
+PERIOD_WEEK = "week"
+PERIOD_MONTH = "month"
+PERIODS = (PERIOD_DAY, PERIOD_WEEK, PERIOD_MONTH)
+
+HOUR = 3600.0
+DAY = 86400.0
+
+# A flow rate stays current for this many reading gaps; after that, no change means no flow.
+FLOW_RATE_GAPS = 2
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store[Dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.timeseries")
+
+
+async def async_remove_series(hass: HomeAssistant, entry_id: str) -> None:
+    await _store(hass, entry_id).async_remove()
+
+
+def period_start(period: str, ts: float) -> float:
+    """Start (epoch seconds) of the local day/week/month containing `ts`."""
+    local = dt_util.as_local(dt_util.utc_from_timestamp(ts))
+    start = local.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == PERIOD_WEEK:
+        start -= timedelta(days=start.weekday())
+    elif period == PERIOD_MONTH:
+        start = start.replace(day=1)
+    return start.timestamp()
+
+
+def _pack(values: array) -> str:
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _unpack(data: str, byteorder: str) -> array:
+    values = array("d")
+    values.frombytes(base64.b64decode(data))
+    if byteorder != sys.byteorder:
+        values.byteswap()
+    return values
+
+
+class ChannelSeries:
+    """Meter readings of one channel in two parallel float arrays (epoch seconds, value).
+
+    Recent points are kept as received; older ones are downsampled to the last
+    reading per hour and then per day. Period consumption and flow rate are kept
+    up to date on every append instead of being recomputed from the history.
+    """
+
+    __slots__ = ("ts", "values", "_baselines", "_compacted_day", "flow_rate")
+
+    def __init__(self) -> None:
+        self.ts = array("d")
+        self.values = array("d")
+        # period -> (period start, meter value at the start of the period)
+        self._baselines: Dict[str, Tuple[float, float]] = {}
+        self._compacted_day = 0.0
+        self.flow_rate: Optional[float] = None  # units per hour between the last two points
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def last(self) -> Optional[Tuple[float, float]]:
+        return (self.ts[-1], self.values[-1]) if self.ts else None
+
+    @property
+    def flow_expires_at(self) -> Optional[float]:
+        """When the last flow rate lapses to 0 unless a new reading changes it."""
+        if self.flow_rate is None or len(self.ts) < 2:
+            return None
+        return self.ts[-1] + FLOW_RATE_GAPS * (self.ts[-1] - self.ts[-2])
+
+    def flow_rate_at(self, now: float) -> Optional[float]:
+        """Flow rate as of `now`: 0 once the meter has not moved for longer than expected."""
+        expires = self.flow_expires_at
+        if expires is None:
+            return self.flow_rate
+        return self.flow_rate if now <= expires else 0.0
+
+    def append(self, ts: float, value: float) -> bool:
+        """Add a reading; returns False for points not newer than the last one."""
+        prev = self.last
+        if prev is not None and ts <= prev[0]:
+            return False
+        for period in PERIODS:
+            start = period_start(period, ts)
+            baseline = self._baselines.get(period)
+            if baseline is None or baseline[0] != start:
+                # New period: it starts from the last reading of the previous one.
+                self._baselines[period] = (start, prev[1] if prev is not None else value)
+        if prev is not None:
+            self.flow_rate = max(0.0, value - prev[1]) / ((ts - prev[0]) / HOUR)
+        self.ts.append(ts)
+        self.values.append(value)
+
+        day = ts - ts % DAY
+        if day != self._compacted_day:
+            self._compacted_day = day
+            self.compact(ts)
+        return True
+
+    def consumption(self, period: str, now: float) -> Optional[float]:
+        """Consumption since the start of the current period (0 if nothing arrived in it yet)."""
+        last = self.last
+        baseline = self._baselines.get(period)
+        if last is None or baseline is None:
+            return None
+        if baseline[0] != period_start(period, now):
+            return 0.0
+        return max(0.0, last[1] - baseline[1])
+
+    def compact(self, now: float) -> None:
+        """Apply retention: hourly resolution past the raw window, daily past the hourly one."""
+        raw_cutoff = now - DEFAULT_SERIES_RAW_RETENTION.total_seconds()
+        hourly_cutoff = now - DEFAULT_SERIES_HOURLY_RETENTION.total_seconds()
+        drop_before = now - DEFAULT_SERIES_DAILY_RETENTION.total_seconds()
+        if not self.ts or self.ts[0] >= raw_cutoff:
+            return
+
+        ts, values = array("d"), array("d")
+        bucket_of_last: Optional[float] = None
+        for t, v in zip(self.ts, self.values):
+            if t < drop_before:
+                continue
+            if t >= raw_cutoff:
+                bucket = None
+            else:
+                step = DAY if t < hourly_cutoff else HOUR
+                bucket = t - t % step
+            if bucket is not None and bucket == bucket_of_last:
+                # Same bucket: the later reading wins (meters are cumulative).
+                ts[-1], values[-1] = t, v
+                continue
+            ts.append(t)
+            values.append(v)
+            bucket_of_last = bucket
+        self.ts, self.values = ts, values
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "ts": _pack(self.ts),
+            "values": _pack(self.values),
+            "baselines": {p: list(b) for p, b in self._baselines.items()},
+            "flow_rate": self.flow_rate,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any], byteorder: str) -> "ChannelSeries":
+        series = cls()
+        series.ts = _unpack(raw["ts"], byteorder)
+        series.values = _unpack(raw["values"], byteorder)
+        if len(series.ts) != len(series.values):
+            raise ValueError("timestamp/value length mismatch")
+        series._baselines = {p: (float(b[0]), float(b[1])) for p, b in (raw.get("baselines") or {}).items()}
+        series.flow_rate = raw.get("flow_rate")
+        if series.ts:
+            series._compacted_day = series.ts[-1] - series.ts[-1] % DAY
+        return series
+
+
+class WateriusSeriesStore:
+    """Per-channel ChannelSeries for one config entry, persisted with a delayed save."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = _store(hass, entry_id)
+        self.series: Dict[int, ChannelSeries] = {}
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        byteorder = data.get("byteorder", sys.byteorder)
+        for key, raw in (data.get("channels") or {}).items():
+            try:
+                self.series[int(key)] = ChannelSeries.from_dict(raw, byteorder)
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def _payload(self) -> Dict[str, Any]:
+        return {
+            "byteorder": sys.byteorder,
+            "channels": {str(cid): series.as_dict() for cid, series in self.series.items()},
+        }
+
+    def get(self, channel_id: int) -> Optional[ChannelSeries]:
+        return self.series.get(channel_id)
+
+    def ingest(self, channels: Iterable[Any]) -> None:
+        """Append the current reading of each channel (WateriusChannel records) at its fetch time."""
+        changed = False
+        for ch in channels:
+            if ch.updated_at is None or ch.error is not None:
+                continue
+            try:
+                value = float(ch.last_value)
+            except (TypeError, ValueError):
+                continue
+            series = self.series.get(ch.channel_id)
+            if series is None:
+                series = self.series[ch.channel_id] = ChannelSeries()
+            last = series.last
+            if last is not None and last[1] == value:
+                continue
+            changed |= series.append(ch.updated_at.timestamp(), value)
+        if changed:
+            self._store.async_delay_save(self._payload, SAVE_DELAY)
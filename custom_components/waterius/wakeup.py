@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from statistics import median
+from typing import Any, Dict, List, Optional
+
+from homeassistant.util import dt as dt_util
+
+DEFAULT_PERIOD = timedelta(hours=24)
+MIN_PERIOD = timedelta(hours=1)
+MAX_PERIOD = timedelta(days=7)
+HISTORY_SIZE = 8
+
+
+def _parse_wakeup(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, str) and value.strip():
+        try:
+            dt = dt_util.parse_datetime(value.strip())
+        except ValueError:
+            dt = None
+    else:
+        dt = None
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=dt_util.UTC)
+    return dt
+
+
+class WakeupTracker:
+    """Learns each source's wakeup cadence from successive `last_wakeup` values.
+
+    The period is the median gap between the last few distinct wakeups (24 h until
+    there are two of them). Polling is dense inside a window around the next
+    expected wakeup and backs off to `max_interval` elsewhere.
+    """
+
+    def __init__(self, lead: timedelta, window: timedelta) -> None:
+        self.lead = lead
+        self.window = window
+        self._history: Dict[int, List[datetime]] = {}
+
+    def observe(self, source_id: int, last_wakeup: Any) -> bool:
+        """Record a wakeup; returns True if it was new."""
+        dt = _parse_wakeup(last_wakeup)
+        if dt is None:
+            return False
+        hist = self._history.setdefault(source_id, [])
+        if hist and dt <= hist[-1]:
+            return False
+        hist.append(dt)
+        del hist[:-HISTORY_SIZE]
+        return True
+
+    def forget_missing(self, source_ids) -> None:
+        for sid in list(self._history):
+            if sid not in source_ids:
+                del self._history[sid]
+
+    def period(self, source_id: int) -> timedelta:
+        hist = self._history.get(source_id) or []
+        gaps = [b - a for a, b in zip(hist, hist[1:])]
+        if not gaps:
+            return DEFAULT_PERIOD
+        return min(MAX_PERIOD, max(MIN_PERIOD, median(gaps)))
+
+    def next_expected(self, source_id: int, now: datetime) -> Optional[datetime]:
+        """Next expected wakeup whose polling window has not passed yet."""
+        hist = self._history.get(source_id)
+        if not hist:
+            return None
+        period = self.period(source_id)
+        expected = hist[-1] + period
+        if expected + self.window < now:
+            # Missed wakeups: roll forward to the next slot.
+            missed = (now - self.window - expected) // period + 1
+            expected += period * missed
+        return expected
+
+    def next_interval(self, now: datetime, dense: timedelta, max_interval: timedelta) -> timedelta:
+        """Polling interval to use from `now`."""
+        starts: List[datetime] = []
+        for sid in self._history:
+            expected = self.next_expected(sid, now)
+            if expected is None:
+                continue
+            start = expected - self.lead
+            if start <= now <= expected + self.window:
+                return dense
+            starts.append(start)
+        if not starts:
+            return dense
+        return min(max_interval, max(dense, min(starts) - now))
+
+    def as_dict(self, now: datetime) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for sid, hist in self._history.items():
+            expected = self.next_expected(sid, now)
+            out[str(sid)] = {
+                "last_wakeup": hist[-1].isoformat(),
+                "period_hours": round(self.period(sid).total_seconds() / 3600, 2),
+                "next_expected": expected.isoformat() if expected else None,
+                "samples": len(hist),
+            }
+        return out
+
+    def dump(self) -> Dict[str, List[str]]:
+        return {str(sid): [dt.isoformat() for dt in hist] for sid, hist in self._history.items()}
+
+    def load(self, raw: Any) -> None:
+        if not isinstance(raw, dict):
+            return
+        for sid, values in raw.items():
+            try:
+                source_id = int(sid)
+            except (TypeError, ValueError):
+                continue
+            for value in values if isinstance(values, list) else []:
+                self.observe(source_id, value)
@@ -0,0 +1,117 @@
+import asyncio
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from custom_components.waterius import api as api_mod
+from custom_components.waterius.api import (
+    WateriusApi,
+    WateriusCircuitOpenError,
+    WateriusTransportError,
+    _CircuitBreaker,
+    _remaining_page_urls,
+)
+
+
+def _page(url):
+    return dict(parse_qsl(urlsplit(url).query))["page"]
+
+
+def test_remaining_page_urls_from_page_numbers():
+    urls = _remaining_page_urls("https://x/api/channel/?page=2&page_size=10", 35, 10)
+    assert [_page(u) for u in urls] == ["2", "3", "4"]
+    assert all("page_size=10" in u for u in urls)
+
+
+def test_remaining_page_urls_unpredictable():
+    assert _remaining_page_urls(None, 35, 10) is None
+    assert _remaining_page_urls("https://x/api/channel/?cursor=abc", 35, 10) is None
+    assert _remaining_page_urls("https://x/api/channel/?page=2", None, 10) is None
+    assert _remaining_page_urls("https://x/api/channel/?page=2", 35, 0) is None
+
+
+def _open_breaker(monkeypatch, reset_timeout=30.0):
+    clock = [1000.0]
+    monkeypatch.setattr(api_mod.time, "monotonic", lambda: clock[0])
+    breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=reset_timeout)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker, clock
+
+
+def test_breaker_opens_after_threshold_and_half_opens_after_timeout(monkeypatch):
+    breaker, clock = _open_breaker(monkeypatch)
+    assert breaker.state == _CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.retry_in() == 30.0
+
+    clock[0] += 30
+    assert breaker.allow()  # the probe
+    assert breaker.state == _CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()  # only one probe at a time
+
+    breaker.record_success()
+    assert breaker.state == _CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_breaker_failed_probe_reopens(monkeypatch):
+    breaker, clock = _open_breaker(monkeypatch)
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == _CircuitBreaker.OPEN
+    assert breaker.times_opened == 2
+
+
+def test_breaker_aborted_probe_is_released(monkeypatch):
+    breaker, clock = _open_breaker(monkeypatch)
+    clock[0] += 30
+    assert breaker.allow()
+
+    breaker.record_aborted()
+
+    assert breaker.state == _CircuitBreaker.OPEN
+    clock[0] += 30
+    assert breaker.allow()
+
+
+def test_record_aborted_does_not_count_outside_a_probe():
+    breaker = _CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    assert breaker.allow()
+    breaker.record_aborted()
+    assert breaker.state == _CircuitBreaker.CLOSED
+
+
+def test_cancelled_probe_does_not_lock_out_requests(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(api_mod.time, "monotonic", lambda: clock[0])
+    client = WateriusApi(None, "token", max_retries=0, circuit_failure_threshold=1, circuit_reset_timeout=30)
+    outcomes = []
+
+    async def _request_once(*args, **kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(client, "_request_once", _request_once)
+
+    async def _run():
+        outcomes.append(WateriusTransportError("down"))
+        with pytest.raises(WateriusTransportError):
+            await client._request_with_retries("GET", "https://x/api/source/")
+        with pytest.raises(WateriusCircuitOpenError):
+            await client._request_with_retries("GET", "https://x/api/source/")
+
+        clock[0] += 30
+        outcomes.append(asyncio.CancelledError())
+        with pytest.raises(asyncio.CancelledError):
+            await client._request_with_retries("GET", "https://x/api/source/")
+
+        clock[0] += 30
+        outcomes.append({"ok": True})
+        return await client._request_with_retries("GET", "https://x/api/source/")
+
+    assert asyncio.run(_run()) == {"ok": True}
+    assert client.transport_state["circuit"] == _CircuitBreaker.CLOSED
@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+
+from custom_components.waterius.coordinator import (
+    STRUCTURE_KEY,
+    WateriusChannel,
+    WateriusData,
+    WateriusExport,
+    WateriusSource,
+    channel_key,
+    diff_data,
+    export_key,
+    source_key,
+    touched_source_ids,
+)
+
+NOW = datetime(2026, 3, 10, tzinfo=timezone.utc)
+
+
+def _channel(channel_id, last_value="1.0", updated_at=NOW, **kwargs):
+    fields = dict(
+        channel_id=channel_id,
+        source_id=1,
+        export_id=10,
+        data_type=0,
+        serial=f"S{channel_id}",
+        report_status=None,
+        service_date=None,
+        warnings=None,
+        last_value=last_value,
+        uk_vals={},
+        updated_at=updated_at,
+    )
+    fields.update(kwargs)
+    return WateriusChannel(**fields)
+
+
+def _data(channels, exports=None, sources=None):
+    return WateriusData(
+        sources=sources or {1: WateriusSource(1, "Дом", None)},
+        channels_by_source={1: channels},
+        exports_by_source={1: exports if exports is not None else {10: WateriusExport(10)}},
+    )
+
+
+def test_diff_data_ignores_refresh_timestamps():
+    old = _data([_channel(1), _channel(2)])
+    new = _data([_channel(1, updated_at=None), _channel(2)])
+    assert diff_data(old, new) == set()
+
+
+def test_diff_data_reports_changed_items_only():
+    old = _data([_channel(1), _channel(2)])
+    new = _data(
+        [_channel(1, last_value="2.0"), _channel(2)],
+        exports={10: WateriusExport(10, tarif_ended="2026-04-01")},
+        sources={1: WateriusSource(1, "Дача", None)},
+    )
+    assert diff_data(old, new) == {channel_key(1), export_key(10), source_key(1)}
+
+
+def test_diff_data_flags_structure_on_added_and_removed_items():
+    old = _data([_channel(1), _channel(2)])
+    new = _data([_channel(1), _channel(3)])
+    assert diff_data(old, new) == {channel_key(2), channel_key(3), STRUCTURE_KEY}
+
+
+def test_data_dict_round_trip():
+    data = _data([_channel(1, uk_vals={"timestamp": "x"})], exports={10: WateriusExport(10, title2="УК")})
+    restored = WateriusData.from_dict(data.as_dict())
+    assert restored == data
+    assert restored.channels_by_id[1].updated_at == NOW
+    assert diff_data(data, restored) == set()
+
+
+def test_touched_source_ids_follow_added_items():
+    sources = {1: WateriusSource(1, "Дом", None), 2: WateriusSource(2, "Дача", None)}
+    data = WateriusData(
+        sources=sources,
+        channels_by_source={1: [_channel(1)], 2: [_channel(2, source_id=2)]},
+        exports_by_source={},
+    )
+    assert touched_source_ids(data, {channel_key(2), STRUCTURE_KEY}) == {2}
+    assert touched_source_ids(data, {source_key(1), export_key(10)}) == {1}
+    # Removed items no longer belong to any current source.
+    assert touched_source_ids(data, {channel_key(99), source_key(99)}) == set()
@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.waterius.const import DEFAULT_PUSH_RECONCILE_INTERVAL
+from custom_components.waterius.coordinator import WateriusCoordinator
+
+
+def _coordinator(**kwargs):
+    return WateriusCoordinator(None, None, update_interval=timedelta(minutes=15), **kwargs)
+
+
+def test_adaptive_back_off_gap_is_not_stale():
+    c = _coordinator(adaptive=True, stale_after=timedelta(hours=6))
+    now = dt_util.utcnow()
+    # One poll gap at the back-off maximum, plus the time the refresh took.
+    assert c.is_fresh(now - c.adaptive_max_interval - timedelta(minutes=2))
+    # A failed poll in between doubles the gap.
+    assert c.is_fresh(now - 2 * c.adaptive_max_interval - timedelta(minutes=2))
+    assert not c.is_fresh(now - 3 * c.adaptive_max_interval)
+
+
+def test_stale_after_applies_without_back_off():
+    c = _coordinator(stale_after=timedelta(hours=1))
+    now = dt_util.utcnow()
+    assert c.is_fresh(now - timedelta(minutes=59))
+    assert not c.is_fresh(now - timedelta(minutes=61))
+    assert not c.is_fresh(None)
+
+
+def test_push_reconcile_interval_stretches_stale_after():
+    # Push mode polls the cloud only every DEFAULT_PUSH_RECONCILE_INTERVAL minutes.
+    c = WateriusCoordinator(
+        None, None, update_interval=timedelta(minutes=DEFAULT_PUSH_RECONCILE_INTERVAL), stale_after=timedelta(hours=6)
+    )
+    now = dt_util.utcnow()
+    reconcile = timedelta(minutes=DEFAULT_PUSH_RECONCILE_INTERVAL)
+    assert c.is_fresh(now - reconcile - timedelta(minutes=2))
+    assert c.is_fresh(now - 2 * reconcile - timedelta(minutes=2))
+
+
+def test_export_may_be_a_whole_tier_old():
+    c = _coordinator(stale_after=timedelta(hours=6), exports_interval=timedelta(hours=24))
+    now = dt_util.utcnow()
+    assert not c.is_fresh(now - timedelta(hours=23))
+    assert c.is_export_fresh(now - timedelta(hours=23))
+    assert c.is_export_fresh(now - timedelta(hours=29))
+    assert not c.is_export_fresh(now - timedelta(hours=31))
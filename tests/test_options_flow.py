@@ -0,0 +1,31 @@
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.waterius.const import CONF_TOKEN
+from custom_components.waterius.options_flow import WateriusOptionsFlowHandler
+
+
+def _flow():
+    entry = SimpleNamespace(entry_id="e1", data={CONF_TOKEN: "old", "scan_interval": 15}, options={})
+    flow = WateriusOptionsFlowHandler(entry)
+    flow.hass = SimpleNamespace(data={})
+    flow.handler = entry.entry_id
+    flow.flow_id = "f1"
+    return flow
+
+
+def test_init_shows_form_with_current_values():
+    result = asyncio.run(_flow().async_step_init())
+    assert result["type"] == "form"
+    assert result["description_placeholders"] == {"webhook_url": "не используется"}
+
+
+def test_init_rejects_blank_token():
+    result = asyncio.run(_flow().async_step_init({CONF_TOKEN: "  ", "scan_interval": 15}))
+    assert result["errors"] == {"base": "invalid_token"}
+
+
+def test_init_strips_token():
+    result = asyncio.run(_flow().async_step_init({CONF_TOKEN: " new ", "scan_interval": 30}))
+    assert result["type"] == "create_entry"
+    assert result["data"] == {CONF_TOKEN: "new", "scan_interval": 30}
@@ -0,0 +1,17 @@
+from types import SimpleNamespace
+
+from custom_components.waterius.const import CONF_WEBHOOK_ID
+from custom_components.waterius.push import MAX_UNKNOWN_SERIALS, WateriusPushReceiver, parse_device_payload
+
+
+def test_parse_device_payload_maps_serials_to_values():
+    payload = {"ch0": "12,5", "serial0": " A1 ", "ch1": 3, "serial1": "", "ch2": "x", "serial2": "C3", "voltage": 3.1}
+    assert parse_device_payload(payload) == {"A1": 12.5}
+
+
+def test_unknown_serials_are_capped_and_only_counted():
+    receiver = WateriusPushReceiver(None, SimpleNamespace(data={CONF_WEBHOOK_ID: "secret"}), None)
+    receiver._track_unknown(f"S{i}" for i in range(MAX_UNKNOWN_SERIALS * 2))
+
+    assert len(receiver.unknown_serials) == MAX_UNKNOWN_SERIALS
+    assert receiver.as_dict()["unknown_serials"] == MAX_UNKNOWN_SERIALS
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from custom_components.waterius.scheduler import WateriusRequestScheduler, gather_bounded
+
+
+def test_single_flight_shares_one_request():
+    scheduler = WateriusRequestScheduler()
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def _run():
+        return await asyncio.gather(*(scheduler.single_flight("k", factory) for _ in range(3)))
+
+    assert asyncio.run(_run()) == ["result"] * 3
+    assert len(calls) == 1
+    assert scheduler.coalesced == 2
+
+
+def test_single_flight_follower_survives_cancelled_leader():
+    scheduler = WateriusRequestScheduler()
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def _run():
+        leader = asyncio.create_task(scheduler.single_flight("k", factory))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(scheduler.single_flight("k", factory))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    # The follower is not cancelled: it runs the request itself.
+    assert asyncio.run(_run()) == 2
+    assert len(calls) == 2
+
+
+def test_single_flight_shares_errors():
+    scheduler = WateriusRequestScheduler()
+
+    async def factory():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def _run():
+        return await asyncio.gather(
+            scheduler.single_flight("k", factory), scheduler.single_flight("k", factory), return_exceptions=True
+        )
+
+    results = asyncio.run(_run())
+    assert [type(r) for r in results] == [ValueError, ValueError]
+
+
+def test_gather_bounded_limits_concurrency_and_keeps_order():
+    in_flight = []
+    peak = []
+
+    async def fn(item):
+        in_flight.append(item)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01 * (5 - item))
+        in_flight.remove(item)
+        if item == 3:
+            raise ValueError(item)
+        return item * 10
+
+    results = asyncio.run(gather_bounded(range(5), fn, 2))
+
+    assert max(peak) == 2
+    assert results[:3] == [0, 10, 20] and results[4] == 40
+    assert isinstance(results[3], ValueError)
@@ -0,0 +1,123 @@
+import sys
+from datetime import datetime, timezone
+
+from custom_components.waterius.timeseries import (
+    DAY,
+    HOUR,
+    PERIOD_DAY,
+    PERIOD_MONTH,
+    ChannelSeries,
+    period_start,
+)
+
+# 2026-03-10 00:00 UTC (a Tuesday); HA's default time zone in tests is UTC.
+T0 = datetime(2026, 3, 10, tzinfo=timezone.utc).timestamp()
+
+
+def test_append_ignores_points_not_newer_than_last():
+    s = ChannelSeries()
+    assert s.append(T0 + HOUR, 10.0)
+    assert not s.append(T0 + HOUR, 11.0)
+    assert not s.append(T0, 12.0)
+    assert s.last == (T0 + HOUR, 10.0)
+
+
+def test_consumption_counts_from_last_reading_of_previous_period():
+    s = ChannelSeries()
+    s.append(T0 - HOUR, 100.0)  # previous day
+    s.append(T0 + 2 * HOUR, 100.5)
+    s.append(T0 + 5 * HOUR, 101.25)
+    assert s.consumption(PERIOD_DAY, T0 + 6 * HOUR) == 1.25
+    assert s.consumption(PERIOD_MONTH, T0 + 6 * HOUR) == 1.25
+
+
+def test_consumption_is_zero_after_rollover_without_reading():
+    s = ChannelSeries()
+    s.append(T0 + HOUR, 1.0)
+    s.append(T0 + 2 * HOUR, 2.0)
+    assert s.consumption(PERIOD_DAY, T0 + DAY + HOUR) == 0.0
+
+
+def test_meter_reset_never_gives_negative_consumption_or_flow():
+    s = ChannelSeries()
+    s.append(T0 + HOUR, 50.0)
+    s.append(T0 + 2 * HOUR, 3.0)
+    assert s.consumption(PERIOD_DAY, T0 + 2 * HOUR) == 0.0
+    assert s.flow_rate == 0.0
+
+
+def test_flow_rate_between_last_two_points():
+    s = ChannelSeries()
+    s.append(T0, 10.0)
+    s.append(T0 + 2 * HOUR, 11.0)
+    assert s.flow_rate == 0.5
+    assert s.flow_rate_at(T0 + 3 * HOUR) == 0.5
+
+
+def test_flow_rate_lapses_to_zero_when_meter_stops():
+    s = ChannelSeries()
+    s.append(T0, 10.0)
+    s.append(T0 + HOUR, 10.5)
+    assert s.flow_expires_at == T0 + 3 * HOUR
+    assert s.flow_rate_at(T0 + 3 * HOUR) == 0.5
+    # Two days later with no change the meter is clearly idle.
+    assert s.flow_rate_at(T0 + 2 * DAY) == 0.0
+
+
+def test_flow_rate_unknown_with_single_point():
+    s = ChannelSeries()
+    s.append(T0, 10.0)
+    assert s.flow_rate is None
+    assert s.flow_rate_at(T0 + DAY) is None
+
+
+def test_compact_downsamples_by_age():
+    s = ChannelSeries()
+    now = T0 + 500 * DAY
+    old = now - 450 * DAY  # past daily retention: dropped
+    daily = now - 100 * DAY  # daily buckets
+    hourly = now - 10 * DAY  # hourly buckets
+    for base in (old, daily, hourly):
+        for i in range(4):
+            s.ts.append(base + i * 10 * 60)
+            s.values.append(float(i))
+    s.ts.append(now - HOUR)
+    s.values.append(9.0)
+
+    s.compact(now)
+
+    assert list(s.ts) == [daily + 30 * 60, hourly + 30 * 60, now - HOUR]
+    assert list(s.values) == [3.0, 3.0, 9.0]
+
+
+def test_dict_round_trip():
+    s = ChannelSeries()
+    s.append(T0, 1.0)
+    s.append(T0 + HOUR, 2.5)
+
+    restored = ChannelSeries.from_dict(s.as_dict(), sys.byteorder)
+
+    assert list(restored.ts) == list(s.ts)
+    assert list(restored.values) == list(s.values)
+    assert restored.flow_rate == s.flow_rate
+    assert restored.consumption(PERIOD_DAY, T0 + HOUR) == 1.5
+
+
+def test_from_dict_swaps_foreign_byte_order():
+    s = ChannelSeries()
+    s.append(T0, 1.0)
+    s.append(T0 + HOUR, 2.5)
+    s.ts.byteswap()
+    s.values.byteswap()
+    foreign = "big" if sys.byteorder == "little" else "little"
+
+    restored = ChannelSeries.from_dict(s.as_dict(), foreign)
+
+    assert list(restored.ts) == [T0, T0 + HOUR]
+    assert list(restored.values) == [1.0, 2.5]
+
+
+def test_period_start_week_begins_on_monday():
+    monday = datetime(2026, 3, 9, tzinfo=timezone.utc).timestamp()
+    assert period_start("week", T0 + 5 * HOUR) == monday
+    assert period_start(PERIOD_MONTH, T0) == datetime(2026, 3, 1, tzinfo=timezone.utc).timestamp()
@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+
+from custom_components.waterius.wakeup import DEFAULT_PERIOD, WakeupTracker
+
+T0 = datetime(2026, 3, 10, 6, 0, tzinfo=timezone.utc)
+DENSE = timedelta(minutes=15)
+MAX = timedelta(hours=6)
+
+
+def _tracker():
+    return WakeupTracker(lead=timedelta(minutes=10), window=timedelta(minutes=30))
+
+
+def test_observe_only_accepts_newer_wakeups():
+    t = _tracker()
+    assert t.observe(1, T0.isoformat())
+    assert not t.observe(1, T0.isoformat())
+    assert not t.observe(1, (T0 - timedelta(hours=1)).isoformat())
+    assert not t.observe(1, None)
+    assert not t.observe(1, "not a date")
+
+
+def test_period_is_median_gap():
+    t = _tracker()
+    assert t.period(1) == DEFAULT_PERIOD
+    for hours in (0, 12, 24, 40):
+        t.observe(1, T0 + timedelta(hours=hours))
+    assert t.period(1) == timedelta(hours=12)
+
+
+def test_next_expected_rolls_over_missed_wakeups():
+    t = _tracker()
+    t.observe(1, T0)
+    t.observe(1, T0 + timedelta(hours=12))
+    now = T0 + timedelta(hours=37)
+    assert t.next_expected(1, now) == T0 + timedelta(hours=48)
+
+
+def test_next_interval_dense_inside_window_and_backs_off_outside():
+    t = _tracker()
+    t.observe(1, T0)
+    t.observe(1, T0 + timedelta(hours=24))
+    expected = T0 + timedelta(hours=48)
+
+    assert t.next_interval(expected - timedelta(minutes=5), DENSE, MAX) == DENSE
+    assert t.next_interval(expected - timedelta(hours=2), DENSE, MAX) == timedelta(hours=1, minutes=50)
+    assert t.next_interval(expected - timedelta(hours=12), DENSE, MAX) == MAX
+
+
+def test_dump_load_round_trip():
+    t = _tracker()
+    t.observe(1, T0)
+    t.observe(1, T0 + timedelta(hours=24))
+    restored = _tracker()
+    restored.load(t.dump())
+    assert restored.period(1) == timedelta(hours=24)
+    assert restored.next_expected(1, T0 + timedelta(hours=25)) == T0 + timedelta(hours=48)